@@ -0,0 +1,137 @@
+import asyncio
+import functools
+import math
+import threading
+import time
+
+import networkx as nx
+from augmentation import AugmentationResult, augment_connectivity
+from compact_graph import CompactGraph
+from complement import ComplementView
+from decomposition import connected_components
+from generator import harary_edges
+from graph_utils import verify_augmentation
+from lower_bounds import deficiencies, degree_bound, extreme_set_bound
+from matching import compute_maximum_matching
+from tracing import DeadlineExceeded, count, deadline_scope, logger, tracing
+
+
+class AnytimeResult(AugmentationResult):
+    """
+    AugmentationResult of a deadline-bounded run. `new_edges` always pass
+    verify_augmentation. `complete` is False when the deadline or a
+    cancellation cut the improvement short.
+    """
+
+    def __init__(self, graph, new_edges, lower_bound, complete, trace=None):
+        super().__init__(graph, new_edges, trace=trace, lower_bound=lower_bound)
+        self.complete = complete
+
+    def __repr__(self):
+        return (f"AnytimeResult({len(self.new_edges)} new edges, lower bound {self.lower_bound}, "
+                f"complete={self.complete})")
+
+
+def _matching_seed(G, target):
+    """The matching phase alone: pair up the degree-(target-1) vertices in the complement."""
+    vertices = [u for u, d in G.degree() if d == target - 1]
+    return compute_maximum_matching(ComplementView(G, vertices))
+
+
+def _fill_seed(G, target):
+    """
+    Always-valid fallback: the edges of a Harary graph H(target, n) missing from G,
+    laid over the vertices in DFS order so that many of its ring edges already exist.
+    """
+    order = [u for component in connected_components(G) for u in nx.dfs_preorder_nodes(G, component[0])]
+    parts = harary_edges(len(order), max(target, 2))
+    edges = {frozenset((order[a], order[b])) for src, dst in parts for a, b in zip(src.tolist(), dst.tolist())}
+    return [tuple(e) for e in edges if len(e) == 2 and not G.has_edge(*e)]
+
+
+def anytime_augmentation(edges, k, target=None, deadline=None, time_budget=None, cancel=None,
+                         trace=None, **options):
+    """
+    augment_connectivity within a time limit, returning the best valid answer so far.
+
+    `deadline` is a time.monotonic() timestamp, `time_budget` seconds from now
+    (the earlier of the two wins) and `cancel` a threading.Event that stops the
+    run early. Every step runs under the deadline; each answer is kept only if
+    it verifies and is smaller:
+    1. the complement matching of the degree-k vertices (fast heuristic seed);
+    2. if that is not valid, a Harary fill, which always is (when time runs out
+       before any answer, the fill is returned without verification);
+    3. the full pipeline, interrupted at its next checkpoint when time runs out;
+    4. removing edges of the answer one at a time while it stays valid.
+    The lower bound starts as half the total deficiency, becomes the degree
+    bound once the seed matching is known, and is tightened with the
+    extreme-set bound only when the seed is above it;
+    steps 3 and 4 stop as soon as the answer meets it.
+    """
+    edges = list(edges.edges()) if isinstance(edges, CompactGraph) else list(edges)
+    target = k + 1 if target is None else target
+    if time_budget is not None:
+        budget_end = time.monotonic() + time_budget
+        deadline = budget_end if deadline is None else min(deadline, budget_end)
+    G = nx.Graph()
+    G.add_edges_from(edges)
+    if G.number_of_nodes() <= target:
+        raise ValueError(f"no simple graph on {G.number_of_nodes()} vertices is {target}-edge-connected")
+
+    with tracing(trace) as trace:
+        # Half the total deficiency until the matching-corrected bound is in
+        bound = math.ceil(sum(deficiencies(G, target).values()) / 2)
+        best = None
+
+        def offer(candidate, stage):
+            nonlocal best
+            if best is not None and len(candidate) >= len(best):
+                return
+            if verify_augmentation(edges, candidate, target - 1, method="certificate"):
+                best = list(candidate)
+                count(f"anytime.{stage}")
+                logger.info("Anytime %s answer: %s edges (lower bound %s)", stage, len(best), bound)
+
+        complete = False
+        try:
+            with deadline_scope(deadline, cancel):
+                seed = _matching_seed(G, target)
+                bound = max(bound, degree_bound(G, target, seed))
+                offer(seed, "matching")
+                if best is None:
+                    offer(_fill_seed(G, target), "fill")
+                if len(best) > bound:
+                    bound = max(bound, extreme_set_bound(G, target) or 0)
+                if len(best) > bound:
+                    offer(augment_connectivity(edges, k, target=target, trace=trace, **options).new_edges, "pipeline")
+                for edge in list(reversed(best)):
+                    if len(best) <= bound:
+                        break
+                    offer([e for e in best if e != edge], "prune")
+            complete = True
+        except DeadlineExceeded:
+            count("anytime.interrupted")
+            if best is None:
+                # Valid by construction (G then contains a Harary graph), so unverified
+                best = _fill_seed(G, target)
+                count("anytime.fill")
+            logger.info("Anytime run stopped with %s edges (lower bound %s)", len(best), bound)
+
+    G.add_edges_from(best)
+    return AnytimeResult(G, best, bound, complete, trace)
+
+
+async def augment_connectivity_async(edges, k, executor=None, **options):
+    """
+    Awaitable anytime_augmentation run on `executor` (the loop's default thread
+    pool by default; the cancel flag is a threading.Event, so it must be a thread
+    executor). Cancelling the awaiting task stops the worker at its next checkpoint.
+    """
+    loop = asyncio.get_running_loop()
+    cancel = threading.Event()
+    call = functools.partial(anytime_augmentation, list(edges), k, cancel=cancel, **options)
+    try:
+        return await loop.run_in_executor(executor, call)
+    except asyncio.CancelledError:
+        cancel.set()
+        raise
@@ -1,116 +1,143 @@
-from graph_utils import get_vertices_of_degree_k, get_subgraph_by_vertices, get_complement_graph
-from matching import compute_maximum_matching, get_unmatched_vertices
+from min_cuts import ConnectivityOracle, MinCutStructure
+from candidate_scoring import score_candidates
+from context import AugmentationContext
+from compact_graph import CompactGraph, as_networkx
+from certificate import certificate_graph
+from speculative import PARALLEL_MIN_EDGES, first_improving_prefix, resolve_workers
+from decomposition import decomposed_augmentation
+from lower_bounds import degree_bound, extreme_set_bound
+from connectivity import compute_edge_connectivity, edge_connectivity_at_least, find_cut_below
+from tracing import count, logger, phase, record, timed, tracing
 import networkx as nx
+import random
+import time
+from itertools import islice
 
 
-def compute_edge_connectivity(G):
-    return nx.edge_connectivity(G)
+def find_min_cut_edges(G, cuts=None):
+    """
+    Find edges that are part of a minimum cut in the graph.
+    Returns potential bottleneck edges that limit connectivity.
+    """
+    if cuts is None:
+        cuts = MinCutStructure(G)
+    return cuts.bottleneck_edges()
 
 
-def is_k_plus_1_edge_connected(G, k):
-    return compute_edge_connectivity(G) >= k + 1
+def _distinct_pairs(edges):
+    """Each unordered pair once, in first-seen order."""
+    seen = set()
+    for u, v in edges:
+        key = frozenset((u, v))
+        if key not in seen:
+            seen.add(key)
+            yield u, v
 
 
-def find_min_cut_edges(G):
+def _add_first_improving(G_aug, added, candidates, target, workers=1, ctx=None):
     """
-    Find edges that are part of a minimum cut in the graph.
-    Returns potential bottleneck edges that limit connectivity.
+    Add candidates in order up to the first one that brings G_aug to `target`
+    (all of them when none does), like a one-at-a-time loop would. Returns True
+    when the target is reached.
+
+    When no process pool would be used and `ctx` is given, the candidates are
+    fed one at a time to a ConnectivityOracle that adopts the context's cut tree
+    of the original graph, so no flows run until every tight tree cut has been
+    crossed. Otherwise the prefix is found by first_improving_prefix.
     """
-    min_cut_value = compute_edge_connectivity(G)
-    min_cut_edges = []
-    
-    # For each pair of vertices, check if their min cut equals the global min cut
-    for u in list(G.nodes())[:10]:  # Limit to avoid excessive computation
-        for v in list(G.nodes())[10:20]:
-            if u != v:
-                try:
-                    cut_value, partition = nx.minimum_cut(G, u, v)
-                    if cut_value == min_cut_value:
-                        # Get the edges that cross this minimum cut
-                        part1, part2 = partition
-                        crossing_edges = [(n1, n2) for n1 in part1 for n2 in part2 if G.has_edge(n1, n2)]
-                        min_cut_edges.extend(crossing_edges)
-                        break  # Found a min cut, no need to check more pairs for this u
-                except nx.NetworkXError:
-                    continue
-    
-    return list(set(min_cut_edges))  # Remove duplicates
+    if ctx is not None and (resolve_workers(workers) == 1 or G_aug.number_of_edges() < PARALLEL_MIN_EDGES):
+        oracle = ConnectivityOracle(G_aug, tree=ctx.min_cuts.tree)
+        for u, v in added:
+            oracle.add_edge(u, v)
+        chosen = []
+        for u, v in candidates:
+            chosen.append((u, v))
+            oracle.add_edge(u, v)
+            if oracle.connectivity >= target:
+                break
+        reached = oracle.connectivity >= target
+    else:
+        prefix = first_improving_prefix(G_aug, candidates, target, workers)
+        chosen = candidates if prefix is None else candidates[:prefix]
+        G_aug.add_edges_from(chosen)
+        reached = prefix is not None
+    count("candidate_edges", len(chosen))
+    added.extend(chosen)
+    logger.debug("Added edges %s, connectivity %s %s", chosen, "reached" if reached else "still below", target)
+    return reached
 
 
-def strategic_edge_addition(G, k):
+@timed("strategic")
+def strategic_edge_addition(G, k, ctx=None, weights=None):
     """
     Strategically add edges to improve connectivity by:
     1. Finding bottleneck regions (min cuts)
     2. Adding edges that cross these bottlenecks
+    Candidates are ranked by candidate_scoring.score_candidates with `weights`.
     """
+    ctx = AugmentationContext(G, k) if ctx is None else ctx
     G_aug = G.copy()
-    original_connectivity = compute_edge_connectivity(G)
+    original_connectivity = ctx.connectivity
     added_edges = []
     
     if original_connectivity > k:
-        print(f"[Info] Graph already has connectivity {original_connectivity} > {k}")
+        logger.info("Graph already has connectivity %s > %s", original_connectivity, k)
         return G_aug, added_edges
     
+    # The exact engine solves the k -> k+1 step with a bounded number of flows;
+    # the heuristics below only run when existing edges block it. Its answer is
+    # memoised on the context, so a stage that already saw it blocked pays nothing
+    result = ctx.exact
+    if result is not None:
+        return result
+    
     # Find minimum cut edges and their endpoints
-    min_cut_edges = find_min_cut_edges(G)
-    print(f"[Debug] Found {len(min_cut_edges)} minimum cut edges")
+    min_cut_edges = find_min_cut_edges(G, ctx.min_cuts)
+    logger.debug("Found %s minimum cut edges", len(min_cut_edges))
     
     if not min_cut_edges:
-        print("[Warning] No minimum cut edges found. Using degree-based approach.")
-        return force_augmentation(G, k)
+        logger.warning("No minimum cut edges found. Using degree-based approach.")
+        count("fallback.force")
+        return force_augmentation(G, k, ctx=ctx)
     
     # Get endpoints of min cut edges
-    endpoints = set()
-    for u, v in min_cut_edges:
-        endpoints.add(u)
-        endpoints.add(v)
-    
-    # Create complement graph to find potential edges to add
-    complement = get_complement_graph(G)
+    endpoints = list(dict.fromkeys(u for edge in min_cut_edges for u in edge))
     
-    # Add edges that connect across the bottleneck
-    potential_edges = []
-    for u in endpoints:
-        for v in endpoints:
-            if u != v and complement.has_edge(u, v):
-                potential_edges.append((u, v, nx.shortest_path_length(G, u, v)))
-    
-    # Sort by path length (prioritize connecting distant nodes)
-    potential_edges.sort(key=lambda x: x[2], reverse=True)
+    # Score every non-adjacent endpoint pair at once (distant pairs first by default)
+    # and keep only the few that are tried (limit number of tries)
+    ranked = score_candidates(G, endpoints, ctx.min_cuts.sides(), k + 1, weights, limit=5)
+    count("candidate_edges", len(ranked))
     
     # Add edges until connectivity increases
-    for u, v, _ in potential_edges:
-        G_aug.add_edge(u, v)
-        added_edges.append((u, v))
-        new_connectivity = compute_edge_connectivity(G_aug)
-        print(f"[Debug] Added edge ({u}, {v}), new connectivity: {new_connectivity}")
-        
-        if new_connectivity > original_connectivity:
-            print(f"[Success] Increased connectivity to {new_connectivity}")
-            return G_aug, added_edges
-        
-        if len(added_edges) >= 5:  # Limit number of tries
-            break
+    candidates = [(u, v) for u, v, _ in ranked]
+    if _add_first_improving(G_aug, added_edges, candidates, original_connectivity + 1, ctx.workers, ctx):
+        logger.info("Increased connectivity to %s", original_connectivity + 1)
+        return G_aug, added_edges
     
-    print("[Warning] Strategic edge addition didn't improve connectivity. Trying force augmentation.")
-    return force_augmentation(G, k, start_graph=G_aug, start_edges=added_edges)
+    logger.warning("Strategic edge addition didn't improve connectivity. Trying force augmentation.")
+    count("fallback.force")
+    return force_augmentation(G, k, start_graph=G_aug, start_edges=added_edges, ctx=ctx)
 
 
-def force_augmentation(G, k, limit=10, start_graph=None, start_edges=None):
+@timed("force")
+def force_augmentation(G, k, limit=10, start_graph=None, start_edges=None, ctx=None, seed=0):
     """
     Add up to `limit` edges from the complement using a smarter strategy to improve connectivity.
+    The complement edges beyond the priority ones are drawn in an order fixed by `seed`.
     """
+    ctx = AugmentationContext(G, k) if ctx is None else ctx
     G_aug = G.copy() if start_graph is None else start_graph
     added = [] if start_edges is None else start_edges.copy()
-    original_connectivity = compute_edge_connectivity(G)
-    print(f"[Debug] Original connectivity: {original_connectivity}, target: >{k}")
+    original_connectivity = ctx.connectivity
+    logger.debug("Original connectivity: %s, target: >%s", original_connectivity, k)
     
     # Get low-degree vertices as they might be bottlenecks
-    low_degree_vertices = get_vertices_of_degree_k(G, k)
-    print(f"[Debug] Found {len(low_degree_vertices)} vertices of degree {k}")
+    low_degree_vertices = ctx.vertices_k
+    logger.debug("Found %s vertices of degree %s", len(low_degree_vertices), k)
     
-    # Get complement graph for potential edges
-    comp = get_complement_graph(G)
+    # Complement view for potential edges
+    comp = ctx.complement
+    target = original_connectivity + 1
     
     # Prioritize edges between low-degree vertices
     priority_edges = []
@@ -120,70 +147,82 @@ def force_augmentation(G, k, limit=10, start_graph=None, start_edges=None):
                 priority_edges.append((u, v))
     
     # Try adding priority edges first
-    for u, v in priority_edges:
-        if len(added) >= limit:
-            break
-        if not G_aug.has_edge(u, v):
-            G_aug.add_edge(u, v)
-            added.append((u, v))
-            new_connectivity = compute_edge_connectivity(G_aug)
-            print(f"[Debug] Added priority edge ({u}, {v}), new connectivity: {new_connectivity}")
-            
-            if new_connectivity > original_connectivity:
-                print(f"[Forced Success] Increased connectivity to {new_connectivity} after adding {len(added)} edges.")
-                return G_aug, added
+    candidates = [e for e in _distinct_pairs(priority_edges) if not G_aug.has_edge(*e)]
+    candidates = candidates[:max(limit - len(added), 0)]
+    if _add_first_improving(G_aug, added, candidates, target, ctx.workers, ctx):
+        logger.info("Increased connectivity to %s after adding %s edges.", target, len(added))
+        return G_aug, added
     
     # If priority edges didn't help, try random edges from complement
-    other_edges = [e for e in comp.edges() if e not in priority_edges]
-    import random
-    random.shuffle(other_edges)
-    
-    for u, v in other_edges:
-        if len(added) >= limit:
-            break
-        if not G_aug.has_edge(u, v):
-            G_aug.add_edge(u, v)
-            added.append((u, v))
-            new_connectivity = compute_edge_connectivity(G_aug)
-            print(f"[Debug] Added random edge ({u}, {v}), new connectivity: {new_connectivity}")
-            
-            if new_connectivity > original_connectivity:
-                print(f"[Forced Success] Increased connectivity to {new_connectivity} after adding {len(added)} edges.")
-                return G_aug, added
+    priority_set = set(priority_edges)
+    other_edges = (e for e in comp.random_edges(random.Random(seed))
+                   if e not in priority_set and not G_aug.has_edge(*e))
+    candidates = list(islice(_distinct_pairs(other_edges), max(limit - len(added), 0)))
+    if _add_first_improving(G_aug, added, candidates, target, ctx.workers, ctx):
+        logger.info("Increased connectivity to %s after adding %s edges.", target, len(added))
+        return G_aug, added
+    
+    # Last resort, always successful on a simple graph with more than `target`
+    # vertices: close the remaining cuts below the target one edge at a time
+    _close_cuts(G_aug, added, target)
     
     new_connectivity = compute_edge_connectivity(G_aug)
     if new_connectivity > original_connectivity:
-        print(f"[Partial Success] Increased connectivity to {new_connectivity}, but not beyond {k}.")
+        logger.info("Increased connectivity to %s, but not beyond %s.", new_connectivity, k)
     else:
-        print(f"[Forced Fallback] Added {len(added)} edges, connectivity still at {new_connectivity}.")
+        logger.warning("Added %s edges, connectivity still at %s.", len(added), new_connectivity)
     
     return G_aug, added
 
 
-def augment_graph_via_matching(G, k):
+def _close_cuts(G_aug, added, target):
+    """
+    While a cut below `target` remains, add the free pair across it with the
+    lowest degrees. A cut with shores S and T has |S| * |T| >= n - 1 pairs, so
+    one is free whenever the cut is smaller than that.
+    """
+    degree = G_aug.degree
+    while True:
+        side = find_cut_below(G_aug, target)
+        if side is None:
+            return
+        side = set(side)
+        other = sorted((u for u in G_aug.nodes() if u not in side), key=degree)
+        pair = next(((a, b) for a in sorted(side, key=degree) for b in other if not G_aug.has_edge(a, b)), None)
+        if pair is None:
+            return
+        G_aug.add_edge(*pair)
+        added.append(pair)
+        count("fallback.cut_closing")
+
+
+@timed("matching_augmentation")
+def augment_graph_via_matching(G, k, ctx=None):
     """
     Improved matching-based augmentation that properly handles the subgraph.
     """
-    original_connectivity = compute_edge_connectivity(G)
-    print(f"[Debug] Original connectivity: {original_connectivity}, target: >{k}")
+    ctx = AugmentationContext(G, k) if ctx is None else ctx
+    original_connectivity = ctx.connectivity
+    logger.debug("Original connectivity: %s, target: >%s", original_connectivity, k)
     
-    vertices_k = get_vertices_of_degree_k(G, k)
-    print(f"[Debug] Found {len(vertices_k)} vertices of degree {k}")
+    vertices_k = ctx.vertices_k
+    logger.debug("Found %s vertices of degree %s", len(vertices_k), k)
     
     if not vertices_k:
-        print(f"[Info] No vertices of degree {k} found. All vertices have degree > {k}.")
+        logger.info("No vertices of degree %s found. All vertices have degree > %s.", k, k)
         return G, []
     
-    G_k = get_subgraph_by_vertices(G, vertices_k)
-    complement_G_k = get_complement_graph(G_k)
+    complement_G_k = ctx.complement_k
     
     # Verify the complement graph has edges
     if complement_G_k.number_of_edges() == 0:
-        print("[Warning] Complement graph has no edges. All possible edges exist in the subgraph.")
-        return strategic_edge_addition(G, k)
+        logger.warning("Complement graph has no edges. All possible edges exist in the subgraph.")
+        count("fallback.strategic")
+        return strategic_edge_addition(G, k, ctx)
     
-    matching = compute_maximum_matching(complement_G_k)
-    print(f"[Debug] Found matching with {len(matching)} edges")
+    matching = ctx.matching
+    record("matching_size", len(matching))
+    logger.debug("Found matching with %s edges", len(matching))
     
     # The matching is already from the subgraph of vertices with degree k,
     # so we don't need to filter
@@ -191,8 +230,9 @@ def augment_graph_via_matching(G, k):
     
     # If no edges found in matching or matching is too small
     if not new_edges or len(new_edges) < len(vertices_k) // 4:
-        print(f"[Fallback] Matching too small ({len(new_edges)} edges). Using strategic edge addition.")
-        return strategic_edge_addition(G, k)
+        logger.info("Matching too small (%s edges). Using strategic edge addition.", len(new_edges))
+        count("fallback.strategic")
+        return strategic_edge_addition(G, k, ctx)
     
     # Add matched edges to original graph
     G_aug = G.copy()
@@ -200,24 +240,27 @@ def augment_graph_via_matching(G, k):
     
     # Check if connectivity improved
     new_connectivity = compute_edge_connectivity(G_aug)
-    print(f"[Debug] After matching, connectivity: {new_connectivity}")
+    logger.debug("After matching, connectivity: %s", new_connectivity)
     
     if new_connectivity <= original_connectivity:
-        print(f"[Backup] Matching didn't improve connectivity. Using strategic forced edge addition...")
-        return strategic_edge_addition(G, k)
+        logger.info("Matching didn't improve connectivity. Using strategic forced edge addition...")
+        count("fallback.strategic")
+        return strategic_edge_addition(G, k, ctx)
     else:
-        print(f"[Success] Edge-connectivity increased to {new_connectivity} after matching.")
+        logger.info("Edge-connectivity increased to %s after matching.", new_connectivity)
     
     return G_aug, new_edges
 
 
-def augment_graph_via_paths(G, unmatched_vertices, complement_G_k, k):
+@timed("path_augmentation")
+def augment_graph_via_paths(G, unmatched_vertices, complement_G_k, k, ctx=None):
     """
     Improved path-based augmentation for unmatched vertices.
     """
-    original_connectivity = compute_edge_connectivity(G)
-    print(f"[Debug] Original connectivity: {original_connectivity}, target: >{k}")
-    print(f"[Debug] Unmatched vertices: {len(unmatched_vertices)}")
+    ctx = AugmentationContext(G, k) if ctx is None else ctx
+    original_connectivity = ctx.connectivity
+    logger.debug("Original connectivity: %s, target: >%s", original_connectivity, k)
+    logger.debug("Unmatched vertices: %s", len(unmatched_vertices))
     
     G_aug = G.copy()
     new_edges = []
@@ -225,7 +268,7 @@ def augment_graph_via_paths(G, unmatched_vertices, complement_G_k, k):
     visited = set()
     
     # First attempt: Try to find paths that connect unmatched vertices through minimum cuts
-    min_cut_edges = find_min_cut_edges(G)
+    min_cut_edges = find_min_cut_edges(G, ctx.min_cuts)
     min_cut_vertices = set()
     for u, v in min_cut_edges:
         min_cut_vertices.add(u)
@@ -246,7 +289,7 @@ def augment_graph_via_paths(G, unmatched_vertices, complement_G_k, k):
                     G_aug.add_edge(mc_vertex, v)
                     new_edges.extend([(u, mc_vertex), (mc_vertex, v)])
                     visited.update([u, v])
-                    print(f"[Debug] Added path through min cut vertex: {u}-{mc_vertex}-{v}")
+                    logger.debug("Added path through min cut vertex: %s-%s-%s", u, mc_vertex, v)
                     break
     
     # Second attempt: Connect through common neighbors in complement
@@ -259,19 +302,18 @@ def augment_graph_via_paths(G, unmatched_vertices, complement_G_k, k):
             if v in visited:
                 continue
             
-            # Check for common neighbors in complement
-            neighbors_u = set(complement_G_k.neighbors(u))
-            neighbors_v = set(complement_G_k.neighbors(v))
-            common = neighbors_u & neighbors_v
+            # Check for a common neighbor in complement
+            intermediary = next(
+                (w for w in complement_G_k.neighbors(u) if complement_G_k.has_edge(w, v)), None
+            )
             
-            if common:
-                intermediary = list(common)[0]
+            if intermediary is not None:
                 if not G_aug.has_edge(u, intermediary) and not G_aug.has_edge(intermediary, v):
                     G_aug.add_edge(u, intermediary)
                     G_aug.add_edge(intermediary, v)
                     new_edges.extend([(u, intermediary), (intermediary, v)])
                     visited.update([u, v])
-                    print(f"[Debug] Added path through common neighbor: {u}-{intermediary}-{v}")
+                    logger.debug("Added path through common neighbor: %s-%s-%s", u, intermediary, v)
                     break
     
     # Third attempt: Direct connections for remaining unmatched vertices
@@ -282,67 +324,221 @@ def augment_graph_via_paths(G, unmatched_vertices, complement_G_k, k):
             if not G_aug.has_edge(u, v):
                 G_aug.add_edge(u, v)
                 new_edges.append((u, v))
-                print(f"[Debug] Added direct edge between unmatched: {u}-{v}")
+                logger.debug("Added direct edge between unmatched: %s-%s", u, v)
     
     # Check if our efforts improved connectivity
     new_connectivity = compute_edge_connectivity(G_aug)
-    print(f"[Debug] After path augmentation, connectivity: {new_connectivity}")
+    logger.debug("After path augmentation, connectivity: %s", new_connectivity)
     
     if new_connectivity <= original_connectivity:
-        print("[Warning] Path augmentation didn't improve connectivity. Using strategic approach.")
-        return strategic_edge_addition(G, k)
+        logger.warning("Path augmentation didn't improve connectivity. Using strategic approach.")
+        count("fallback.strategic")
+        return strategic_edge_addition(G, k, ctx)
     
-    print(f"[Success] Edge-connectivity increased to {new_connectivity} after path augmentation.")
+    logger.info("Edge-connectivity increased to %s after path augmentation.", new_connectivity)
     return G_aug, new_edges
 
 
-def augment_connectivity(edges, k):
+class AugmentationResult:
+    """
+    Outcome of augment_connectivity: the augmented graph, the new edges, one
+    record per connectivity level ({"level", "edges", "seconds", "stage",
+    "reached"}, where stage is "pipeline", or "decomposition" for the block front
+    end), a proven `lower_bound` on the number of new edges (see lower_bounds.py;
+    None when not computed), `reached` (False when the graph falls short of the
+    target) and the Trace with the run's counters and phase timers.
+    Unpacks as (graph, new_edges) like the single-level API always did.
+    """
+
+    def __init__(self, graph, new_edges, levels=None, trace=None, lower_bound=None, reached=True):
+        self.graph = graph
+        self.new_edges = new_edges
+        self.levels = [] if levels is None else levels
+        self.trace = trace
+        self.lower_bound = lower_bound
+        self.reached = reached
+
+    @property
+    def gap(self):
+        """Edges above the lower bound; 0 means the answer is provably optimal."""
+        return None if self.lower_bound is None else len(self.new_edges) - self.lower_bound
+
+    def __iter__(self):
+        return iter((self.graph, self.new_edges))
+
+    def __repr__(self):
+        return (f"AugmentationResult({len(self.new_edges)} new edges, {len(self.levels)} levels, "
+                f"lower bound {self.lower_bound}, reached={self.reached})")
+
+
+def augment_connectivity(edges, k, sparsify=True, target=None, trace=None, workers=1,
+                         deadline=None, time_budget=None):
     """
     Main function to augment connectivity of a graph.
     
     Args:
-        edges: List of edges in the graph
+        edges: List of edges in the graph, or a CompactGraph to run the
+            whole pipeline on the array-backed representation
         k: Target connectivity (want to achieve k+1)
+        sparsify: Run the pipeline on a sparse certificate of the graph
+            when that drops edges
+        target: Connectivity to reach in one call (default k+1). Levels
+            k+1, ..., target are raised in turn on one shared context
+        trace: Trace collecting counters and phase timers (a new one by default)
+        workers: Processes for checking candidate edges in the greedy
+            fallbacks on large graphs (None: all cores); results do not
+            depend on it
+        deadline, time_budget: Switch to anytime mode (see
+            anytime.anytime_augmentation): stop at a time.monotonic()
+            deadline or after time_budget seconds with the best valid answer
         
     Returns:
-        Augmented graph and list of new edges added
+        AugmentationResult, which unpacks as the augmented graph and the
+        list of new edges added (an AnytimeResult in anytime mode). Its
+        lower_bound is the degree bound, tightened with the extreme-set
+        bound only when the answer is above it, and None when the answer
+        does not reach the target
     """
-    G = nx.Graph()
-    G.add_edges_from(edges)
+    if deadline is not None or time_budget is not None:
+        from anytime import anytime_augmentation
+        return anytime_augmentation(edges, k, target=target, deadline=deadline, time_budget=time_budget,
+                                    trace=trace, sparsify=sparsify, workers=workers)
+    if isinstance(edges, CompactGraph):
+        G = edges.copy()
+    else:
+        G = nx.Graph()
+        G.add_edges_from(edges)
+    target = k + 1 if target is None else target
+    
+    with tracing(trace) as trace:
+        with phase("lower_bound"):
+            bound = degree_bound(G, target)
+        new_edges, levels = _augment_levels(G, k, target, sparsify, workers)
+        # The last pipeline level was already checked against the target
+        last = levels[-1] if levels else None
+        if last is not None and last["stage"] == "pipeline" and last["level"] == target:
+            reached = last["reached"]
+        else:
+            reached = edge_connectivity_at_least(G, target)
+        if not reached:
+            # A bound says nothing about an answer that falls short of the target
+            logger.warning("Augmentation did not reach connectivity %s; no lower bound reported.", target)
+            count("lower_bound.incomplete")
+            bound = None
+        elif len(new_edges) > bound:
+            with phase("lower_bound"):
+                original = as_networkx(G).copy()
+                original.remove_edges_from(new_edges)
+                bound = max(bound, extreme_set_bound(original, target) or 0)
+        else:
+            # The answer meets the cheap bound, so it is optimal and no flows are needed
+            count("lower_bound.early_exits")
+    return AugmentationResult(G, new_edges, levels, trace, bound, reached)
+
+
+def _augment_levels(G, k, target, sparsify, workers):
+    """Raise G in place from k to `target`; returns the new edges and per-level records."""
+    work = G
+    if sparsify:
+        with phase("certificate"):
+            H = certificate_graph(G, target)
+        if H.number_of_edges() < G.number_of_edges():
+            # Cuts up to `target` are identical in H, so edges that raise H raise G
+            # too; one certificate serves every level
+            logger.debug("Sparse certificate keeps %s of %s edges", H.number_of_edges(), G.number_of_edges())
+            work = H
+    
+    # The graph is extended in place and the context (connectivity, warm-start
+    # matching) carries over from one level to the next
+    ctx = AugmentationContext(work, k, workers)
+    new_edges = []
+    levels = []
+    
+    def commit(level_edges):
+        added = [(u, v) for u, v in level_edges if not G.has_edge(u, v)]
+        if work is not G:
+            G.add_edges_from(added)
+        ctx.add_edges_from(level_edges)
+        new_edges.extend(added)
+        return added
+    
+    # Disconnected graphs and graphs with bridges split into independent blocks
+    start = time.perf_counter()
+    front_edges = decomposed_augmentation(work, target, workers)
+    if front_edges:
+        added = commit(front_edges)
+        levels.append({"level": ctx.connectivity, "edges": len(added),
+                       "seconds": time.perf_counter() - start, "stage": "decomposition", "reached": True})
+    
+    # Raise one level at a time from the actual connectivity when it is below k
+    for level in range(min(k, ctx.connectivity), target):
+        if ctx.connectivity > level:
+            continue
+        start = time.perf_counter()
+        ctx.set_k(level)
+        with phase("level"):
+            _, level_edges = augment_graph(work, level, ctx)
+        added = commit(level_edges)
+        reached = edge_connectivity_at_least(work, level + 1)
+        levels.append({"level": level + 1, "edges": len(added), "seconds": time.perf_counter() - start,
+                       "stage": "pipeline", "reached": reached})
+        logger.debug("Level %s: added %s edges", level + 1, len(added))
+        if not reached:
+            logger.warning("Could not reach connectivity %s; stopping.", level + 1)
+            break
     
+    return new_edges, levels
+
+
+def augment_graph(G, k, ctx=None):
+    """
+    Run the augmentation pipeline on a graph object towards connectivity k+1.
+    Every stage draws its artifacts from one shared AugmentationContext.
+    Returns the augmented graph and list of new edges added.
+    """
+    ctx = AugmentationContext(G, k) if ctx is None else ctx
     # First check current connectivity
-    current_connectivity = compute_edge_connectivity(G)
-    print(f"Original edge connectivity: {current_connectivity}")
+    current_connectivity = ctx.connectivity
+    logger.info("Original edge connectivity: %s", current_connectivity)
     
     if current_connectivity > k:
-        print(f"[Info] Graph already has connectivity > {k}")
+        logger.info("Graph already has connectivity > %s", k)
         return G, []
     
+    # The exact k -> k+1 engine runs first, on the deficient region only: the
+    # (k+1)-edge-connected parts are contracted to super-vertices
+    result = ctx.exact
+    if result is not None:
+        return result
+    logger.warning("Exact augmentation blocked. Using the matching pipeline.")
+    count("fallback.full_pipeline")
+    
     # Find vertices of degree exactly k
-    vertices_k = get_vertices_of_degree_k(G, k)
-    print(f"[Debug] Found {len(vertices_k)} vertices of degree {k}")
+    vertices_k = ctx.vertices_k
+    logger.debug("Found %s vertices of degree %s", len(vertices_k), k)
     
     # If no vertices of degree k, use strategic approach
     if not vertices_k:
-        print("[Info] No vertices of degree k. Using strategic approach.")
-        return strategic_edge_addition(G, k)
+        logger.info("No vertices of degree k. Using strategic approach.")
+        count("fallback.strategic")
+        return strategic_edge_addition(G, k, ctx)
     
-    # Create subgraph of vertices with degree k
-    G_k = get_subgraph_by_vertices(G, vertices_k)
-    complement_G_k = get_complement_graph(G_k)
+    # Complement of the subgraph induced by degree-k vertices, never materialised
+    complement_G_k = ctx.complement_k
     
     # Compute matching in the complement
-    matching = compute_maximum_matching(complement_G_k)
-    print(f"[Debug] Found matching with {len(matching)} edges")
+    matching = ctx.matching
+    record("matching_size", len(matching))
+    logger.debug("Found matching with %s edges", len(matching))
     
     # Check if matching covers all vertices of degree k
     matched_vertices = set([v for edge in matching for v in edge])
     
     if len(matched_vertices) == len(vertices_k):
-        print("Case 1: Matching covers all degree-k vertices.")
-        return augment_graph_via_matching(G, k)
+        logger.info("Case 1: Matching covers all degree-k vertices.")
+        return augment_graph_via_matching(G, k, ctx)
     else:
-        print("Case 2: Matching does NOT cover all degree-k vertices.")
+        logger.info("Case 2: Matching does NOT cover all degree-k vertices.")
         unmatched = set(vertices_k) - matched_vertices
-        print(f"[Debug] Unmatched vertices: {len(unmatched)}")
-        return augment_graph_via_paths(G, unmatched, complement_G_k, k)
\ No newline at end of file
+        logger.debug("Unmatched vertices: %s", len(unmatched))
+        return augment_graph_via_paths(G, unmatched, complement_G_k, k, ctx)
\ No newline at end of file
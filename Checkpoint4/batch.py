@@ -0,0 +1,141 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Only the standard library is imported here; the graph code is imported lazily
+# inside the workers so the parent and every worker start quickly.
+
+
+def _parse_vertex(token):
+    try:
+        return int(token)
+    except ValueError:
+        return token
+
+
+def read_jsonl(stream, source, default_k):
+    """
+    Yield (graph_id, edges, k) from JSON lines such as
+    {"id": "g1", "k": 2, "edges": [[0, 1], [1, 2], [2, 0]]}.
+    """
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        graph_id = record.get("id", f"{source}:{line_number}")
+        edges = [tuple(edge) for edge in record["edges"]]
+        yield graph_id, edges, record.get("k", default_k)
+
+
+def read_edge_list(stream, source, default_k):
+    """
+    Yield (graph_id, edges, k) from whitespace-separated "u v" lines.
+    Graphs are separated by blank lines; a "# k=3" comment sets k for the graph it precedes.
+    """
+    edges, k, index = [], default_k, 0
+    for line in stream:
+        line = line.strip()
+        if line.startswith("#"):
+            if line[1:].strip().startswith("k="):
+                k = int(line[1:].strip()[2:])
+            continue
+        if not line:
+            if edges:
+                yield f"{source}:{index}", edges, k
+                edges, k, index = [], default_k, index + 1
+            continue
+        u, v = line.split()[:2]
+        edges.append((_parse_vertex(u), _parse_vertex(v)))
+    if edges:
+        yield f"{source}:{index}", edges, k
+
+
+def read_graphs(paths, default_k):
+    """Stream graphs from every input file in order ("-" reads stdin)."""
+    for path in paths:
+        stream = sys.stdin if path == "-" else open(path)
+        reader = read_jsonl if path.endswith(".jsonl") or path == "-" else read_edge_list
+        try:
+            yield from reader(stream, path, default_k)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def solve(job):
+    """Augment one graph and return its result record; runs inside a worker."""
+    graph_id, edges, k = job
+    from augmentation import augment_connectivity
+    from connectivity import compute_edge_connectivity
+    import networkx as nx
+
+    start = time.perf_counter()
+    try:
+        G = nx.Graph()
+        G.add_edges_from(edges)
+        before = compute_edge_connectivity(G)
+        result = augment_connectivity(edges, k)
+        after = compute_edge_connectivity(result.graph)
+    except Exception as error:
+        return {"id": graph_id, "k": k, "error": f"{type(error).__name__}: {error}"}
+    return {
+        "id": graph_id,
+        "k": k,
+        "lambda_before": before,
+        "lambda_after": after,
+        "added_edges": [list(edge) for edge in result.new_edges],
+        "seconds": round(time.perf_counter() - start, 6),
+        "trace": result.trace.as_dict(),
+    }
+
+
+def run_batch(jobs, workers=None, max_in_flight=None):
+    """
+    Yield result records in input order.
+    At most `max_in_flight` graphs are submitted but not yet written, so memory
+    stays bounded however long the input stream is. workers=1 runs inline.
+    """
+    if workers == 1:
+        for job in jobs:
+            yield solve(job)
+        return
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for job in jobs:
+            window.append(pool.submit(solve, job))
+            if len(window) >= max_in_flight:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Augment many graphs non-interactively; results are written as JSON lines in input order."
+    )
+    parser.add_argument("inputs", nargs="+", help=".jsonl files, edge-list files, or - for JSONL on stdin")
+    parser.add_argument("-k", type=int, default=2, help="connectivity level when a graph does not set its own")
+    parser.add_argument("-o", "--output", default="-", help="output JSONL file (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="graphs submitted ahead of the writer")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for record in run_batch(read_graphs(args.inputs, args.k), args.workers, args.max_in_flight):
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Benchmark suites for augment_connectivity and its stages.
+
+The presets stop at 30000 vertices and every family has a lower cap of its own
+(FAMILIES), so the reports do not cover graphs of 1e5-1e6 vertices. The limit
+is the pure-Python cut search behind the augment and verify stages: on these
+families they grow like n^2-n^2.7 (disjoint_union at 3000 vertices already
+takes about 14s), so the caps keep one case to a few minutes, while a single
+case at 1e5 vertices would take hours. Explicit --sizes above a cap are
+skipped for that family.
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import networkx as nx
+from augmentation import augment_connectivity
+from certificate import certificate_graph
+from connectivity import compute_edge_connectivity
+from context import AugmentationContext
+from generator import generate_edges
+
+SUITES = {
+    "quick": [100, 300, 1000],
+    "standard": [1000, 3000, 10000],
+    "full": [1000, 3000, 10000, 30000],
+}
+
+# Default per-case budget: a family stops growing after a case slower than this
+MAX_SECONDS = 60
+
+
+def _cycle(n, rng):
+    return [(i, (i + 1) % n) for i in range(n)]
+
+
+def _near_complete(n, rng):
+    """K_n without a random matching on half of the vertices, so lambda = n - 2."""
+    order = list(range(n))
+    rng.shuffle(order)
+    missing = {frozenset(order[i:i + 2]) for i in range(0, n // 2 - 1, 2)}
+    return [(u, v) for u in range(n) for v in range(u + 1, n) if frozenset((u, v)) not in missing]
+
+
+def _disjoint_union(n, rng):
+    """Disjoint 10-cycles; lambda = 0, so augmenting to 1 has to join them all."""
+    size = 10
+    return [(base + i, base + (i + 1) % size) for base in range(0, n - n % size, size) for i in range(size)]
+
+
+def _sparse_gnp(n, rng):
+    """A random Hamiltonian cycle plus G(n, 2/n), so the graph is connected but sparse."""
+    order = list(range(n))
+    rng.shuffle(order)
+    edges = {(min(order[i], order[i - 1]), max(order[i], order[i - 1])) for i in range(n)}
+    edges.update(nx.fast_gnp_random_graph(n, 2.0 / n, seed=rng.randrange(2 ** 32)).edges())
+    return sorted(edges)
+
+
+def _random_regular(n, rng):
+    return list(nx.random_regular_graph(3, n - n % 2, seed=rng.randrange(2 ** 32)).edges())
+
+
+def _many_degree_k(n, rng, k=3):
+    """A small clique with n - 2k leaves, each joined to k clique vertices: lambda = k."""
+    core = list(range(2 * k))
+    edges = [(u, v) for u in core for v in core if u < v]
+    for leaf in range(2 * k, n):
+        edges.extend((leaf, hub) for hub in rng.sample(core, k))
+    return edges
+
+
+def _prescribed(n, rng, k=4):
+    """lambda = k with n // 10 degree-k vertices and mean degree 2k, from generator.py."""
+    src, dst = generate_edges(n, k, avg_degree=2 * k, seed=rng.randrange(2 ** 32))
+    return list(zip(src.tolist(), dst.tolist()))
+
+
+# name -> (generator(n, rng), largest n the family is run at). The caps keep
+# every case within about a minute: augment scales like n^2.3-n^2.7 here.
+FAMILIES = {
+    "cycle": (_cycle, 3000),
+    "near_complete": (_near_complete, 100),
+    "disjoint_union": (_disjoint_union, 10000),
+    "sparse_gnp": (_sparse_gnp, 10000),
+    "random_regular": (_random_regular, 3000),
+    "many_degree_k": (_many_degree_k, 3000),
+    "prescribed": (_prescribed, 30000),
+}
+
+
+def make_case(family, n, seed=0):
+    """Edges and k of one seeded benchmark graph; the same (family, n, seed) always gives the same graph."""
+    generate, _ = FAMILIES[family]
+    rng = random.Random(f"{seed}:{family}:{n}")
+    edges = generate(n, rng)
+    G = nx.Graph(edges)
+    k = compute_edge_connectivity(G) if nx.is_connected(G) else 0
+    return edges, k
+
+
+def _stages(edges, k):
+    """(name, callable) pairs timed in order; each callable receives the previous result."""
+    return [
+        ("build", lambda _: nx.Graph(edges)),
+        ("certificate", lambda G: certificate_graph(G, k + 1)),
+        ("connectivity", lambda H: (H, compute_edge_connectivity(H))),
+        ("matching", lambda state: AugmentationContext(state[0], k).matching),
+        ("augment", lambda _: augment_connectivity(edges, k)),
+        ("verify", lambda result: compute_edge_connectivity(result.graph)),
+    ]
+
+
+def _run_stages(edges, k, trace_memory):
+    timings = {}
+    value = None
+    outputs = {}
+    for name, stage in _stages(edges, k):
+        if trace_memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        value = stage(value)
+        seconds = time.perf_counter() - start
+        timings[name] = {"seconds": seconds}
+        if trace_memory:
+            timings[name]["peak_bytes"] = tracemalloc.get_traced_memory()[1] - before
+        outputs[name] = value
+    return timings, outputs
+
+
+def run_case(family, n, seed=0, repeat=1, memory=True):
+    """
+    Benchmark one graph: the best of `repeat` timed runs per stage, and the peak
+    traced memory per stage from one extra run under tracemalloc (so the timings
+    never pay the tracing overhead).
+    """
+    edges, k = make_case(family, n, seed)
+    best = None
+    for _ in range(repeat):
+        timings, outputs = _run_stages(edges, k, trace_memory=False)
+        if best is None:
+            best = timings
+        else:
+            for name, entry in timings.items():
+                best[name]["seconds"] = min(best[name]["seconds"], entry["seconds"])
+    if memory:
+        tracemalloc.start()
+        try:
+            traced, _ = _run_stages(edges, k, trace_memory=True)
+        finally:
+            tracemalloc.stop()
+        for name, entry in traced.items():
+            best[name]["peak_bytes"] = entry["peak_bytes"]
+    result = outputs["augment"]
+    return {
+        "family": family,
+        "n": n,
+        "m": len(edges),
+        "k": k,
+        "seed": seed,
+        "added_edges": len(result.new_edges),
+        "lambda_after": outputs["verify"],
+        "seconds": sum(entry["seconds"] for entry in best.values()),
+        "stages": best,
+        "trace": result.trace.as_dict(),
+    }
+
+
+def scaling_exponent(records, stage="augment"):
+    """Least-squares slope of log(seconds) against log(n): about 1 for linear, 2 for quadratic."""
+    points = [(math.log(r["n"]), math.log(r["stages"][stage]["seconds"]))
+              for r in records if r["stages"][stage]["seconds"] > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run_suite(sizes, families=None, seed=0, repeat=1, memory=True, max_seconds=MAX_SECONDS, progress=None):
+    """
+    Run every family over the sizes it supports and return the JSON-ready report.
+    A family stops growing once one of its cases took longer than `max_seconds`
+    (None runs every size up to the family's cap).
+    """
+    families = list(FAMILIES) if families is None else families
+    records = []
+    scaling = {}
+    for family in families:
+        family_records = []
+        for n in sizes:
+            if n > FAMILIES[family][1]:
+                continue
+            record = run_case(family, n, seed, repeat, memory)
+            family_records.append(record)
+            if progress:
+                progress(record)
+            if max_seconds is not None and record["seconds"] > max_seconds:
+                break
+        records.extend(family_records)
+        scaling[family] = scaling_exponent(family_records)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "networkx": nx.__version__,
+            "seed": seed,
+            "repeat": repeat,
+            "sizes": list(sizes),
+        },
+        "results": records,
+        "scaling": scaling,
+    }
+
+
+def compare(report, baseline, tolerance=0.25, floor=0.01):
+    """
+    Stage timings that got slower than the baseline by more than `tolerance`
+    (relative). Timings below `floor` seconds in both runs are noise and ignored.
+    """
+    previous = {(r["family"], r["n"]): r for r in baseline["results"]}
+    regressions = []
+    for record in report["results"]:
+        old = previous.get((record["family"], record["n"]))
+        if old is None:
+            continue
+        for stage, entry in record["stages"].items():
+            if stage not in old["stages"]:
+                continue
+            before, after = old["stages"][stage]["seconds"], entry["seconds"]
+            if max(before, after) < floor:
+                continue
+            if after > before * (1 + tolerance):
+                regressions.append({
+                    "family": record["family"],
+                    "n": record["n"],
+                    "stage": stage,
+                    "baseline": before,
+                    "current": after,
+                    "ratio": after / before if before > 0 else math.inf,
+                })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark augment_connectivity and its stages.")
+    parser.add_argument("--suite", choices=sorted(SUITES), default="quick", help="size preset")
+    parser.add_argument("--sizes", type=int, nargs="+", help="explicit sizes instead of a preset")
+    parser.add_argument("--families", nargs="+", choices=sorted(FAMILIES), help="families to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per case; the fastest is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--max-seconds", type=float, default=MAX_SECONDS,
+                        help="stop a family after a case this slow (default: %(default)s)")
+    parser.add_argument("-o", "--output", default=None, help="write the JSON report here")
+    parser.add_argument("--baseline", default=None, help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+    args = parser.parse_args(argv)
+
+    def progress(record):
+        stages = " ".join(f"{name}={entry['seconds']:.3f}s" for name, entry in record["stages"].items())
+        print(f"{record['family']:>15} n={record['n']:<8} {stages}", file=sys.stderr)
+
+    sizes = args.sizes or SUITES[args.suite]
+    report = run_suite(sizes, args.families, args.seed, args.repeat, not args.no_memory,
+                       args.max_seconds, progress)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            report["regressions"] = compare(report, json.load(f), args.tolerance)
+        for r in report["regressions"]:
+            print(f"[Regression] {r['family']} n={r['n']} {r['stage']}: "
+                  f"{r['baseline']:.3f}s -> {r['current']:.3f}s (x{r['ratio']:.2f})", file=sys.stderr)
+        status = 1 if report["regressions"] else 0
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
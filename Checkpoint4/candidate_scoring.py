@@ -0,0 +1,126 @@
+import numpy as np
+from compact_graph import CompactGraph
+
+# Score = sum of weight * feature; the default ranks by distance alone, like the
+# per-pair shortest-path ordering it replaces
+DEFAULT_WEIGHTS = {"distance": 1.0, "deficiency": 0.0, "cut_separation": 0.0}
+
+
+def _csr(G):
+    """(labels, position, indptr, indices) of G, converting networkx graphs once."""
+    if not isinstance(G, CompactGraph):
+        G = CompactGraph.from_networkx(G, bitset=False)
+    labels, indptr, indices = G.csr()
+    position = {u: i for i, u in enumerate(labels)}
+    return labels, position, np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int64)
+
+
+def pairwise_distances(G, vertices):
+    """
+    Hop distances between every pair of `vertices` as a NumPy matrix (-1 when
+    unreachable), from one batched BFS over the CSR arrays.
+
+    Every vertex carries a bitset of the sources that have reached it; one round
+    ORs the bitsets of all neighbours with np.bitwise_or.reduceat, so a round costs
+    one vectorised pass over the edges for all sources together. Rounds stop once
+    no bitset changes or every pair is resolved.
+    """
+    labels, position, indptr, indices = _csr(G)
+    n = len(labels)
+    sources = np.array([position[u] for u in vertices], dtype=np.int64)
+    e = len(sources)
+    dist = np.full((e, e), -1, dtype=np.int64)
+    if e == 0:
+        return dist
+    words = (e + 63) // 64
+    reach = np.zeros((n, words), dtype=np.uint64)
+    bit = np.arange(e)
+    reach[sources, bit // 64] |= np.left_shift(np.uint64(1), (bit % 64).astype(np.uint64))
+    np.fill_diagonal(dist, 0)
+
+    # reduceat returns the element at the start of an empty segment, so isolated
+    # vertices are masked and a zero row pads the end
+    empty = np.diff(indptr) == 0
+    padded = np.append(indices, n)
+    level = 0
+    while (dist < 0).any() and len(indices):
+        level += 1
+        rows = np.vstack([reach, np.zeros((1, words), dtype=np.uint64)])
+        gathered = np.bitwise_or.reduceat(rows[padded], indptr[:-1], axis=0)
+        gathered[empty] = 0
+        grown = reach | gathered
+        if np.array_equal(grown, reach):
+            break
+        # Newly reached sources at the target vertices get this level as their distance
+        fresh = _unpack(grown[sources] & ~reach[sources], e)
+        dist[fresh.T & (dist < 0)] = level
+        reach = grown
+    return dist
+
+
+def _unpack(words, e):
+    """Boolean (rows, e) matrix of the bits in an (rows, words) uint64 array."""
+    as_bytes = words.astype("<u8").view(np.uint8).reshape(len(words), -1)
+    return np.unpackbits(as_bytes, axis=1, bitorder="little")[:, :e].astype(bool)
+
+
+def score_candidates(G, vertices, cut_sides=(), target=None, weights=None, limit=None):
+    """
+    Rank the non-adjacent unordered pairs of `vertices` as candidate edges.
+
+    Features, combined with `weights` (see DEFAULT_WEIGHTS):
+      distance        hop distance in G (unreachable pairs count as n)
+      deficiency      how far both endpoints are below `target` degree
+      cut_separation  number of the given minimum cuts (one side each) the pair crosses
+    Everything is computed for all pairs at once on NumPy matrices.
+    Returns [(u, v, score)] from the highest score down; ties keep input order.
+    With `limit`, only the best `limit` pairs are selected (np.argpartition) and
+    sorted, instead of every candidate.
+    """
+    weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+    vertices = list(vertices)
+    e = len(vertices)
+    if e < 2:
+        return []
+    n = G.number_of_nodes()
+
+    adjacent = np.zeros((e, e), dtype=bool)
+    where = {u: i for i, u in enumerate(vertices)}
+    for i, u in enumerate(vertices):
+        for v in G.neighbors(u):
+            j = where.get(v)
+            if j is not None:
+                adjacent[i, j] = True
+    rows, cols = np.triu_indices(e, k=1)
+    keep = ~adjacent[rows, cols]
+    rows, cols = rows[keep], cols[keep]
+
+    score = np.zeros(len(rows))
+    if weights["distance"]:
+        dist = pairwise_distances(G, vertices).astype(float)
+        dist[dist < 0] = n
+        score += weights["distance"] * dist[rows, cols]
+    if weights["deficiency"] and target is not None:
+        degree = np.array([G.degree(u) for u in vertices])
+        deficiency = np.maximum(target - degree, 0)
+        score += weights["deficiency"] * (deficiency[rows] + deficiency[cols])
+    if weights["cut_separation"]:
+        sides = [np.array([u in side for u in vertices]) for side in cut_sides]
+        if sides:
+            S = np.array(sides)
+            score += weights["cut_separation"] * (S[:, rows] != S[:, cols]).sum(axis=0)
+
+    order = np.argsort(-score, kind="stable") if limit is None else _top(score, limit)
+    return [(vertices[rows[i]], vertices[cols[i]], float(score[i])) for i in order]
+
+
+def _top(score, limit):
+    """Indices of the `limit` highest scores, best first; ties keep index order."""
+    if limit >= len(score):
+        return np.argsort(-score, kind="stable")
+    if limit <= 0:
+        return np.array([], dtype=np.int64)
+    threshold = score[np.argpartition(-score, limit - 1)[:limit]].min()
+    above = np.flatnonzero(score > threshold)
+    chosen = np.union1d(above, np.flatnonzero(score == threshold)[:limit - len(above)])
+    return chosen[np.argsort(-score[chosen], kind="stable")]
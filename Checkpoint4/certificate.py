@@ -0,0 +1,120 @@
+import networkx as nx
+from compact_graph import CompactGraph
+
+
+def sparse_certificate(G, k):
+    """
+    Edges of the first k Nagamochi-Ibaraki forests of G.
+
+    A scan-first search in maximum-adjacency order puts edge (x, y) into forest
+    r(y) + 1, where r(y) counts the scanned neighbours of y so far. The union of the
+    first k forests has at most k(n-1) edges and keeps every local edge-connectivity
+    up to k: lambda(u, v) in the certificate >= min(lambda(u, v) in G, k). Runs in
+    O(n + m) with a bucket queue.
+    """
+    rank = {v: 0 for v in G.nodes()}
+    buckets = [set(rank)]
+    top = 0
+    scanned = set()
+    kept = []
+    while len(scanned) < len(rank):
+        while not buckets[top]:
+            top -= 1
+        x = buckets[top].pop()
+        scanned.add(x)
+        for y in G.neighbors(x):
+            if y in scanned:
+                continue
+            r = rank[y]
+            if r < k:
+                kept.append((x, y))
+            buckets[r].discard(y)
+            rank[y] = r + 1
+            if r + 1 == len(buckets):
+                buckets.append(set())
+            buckets[r + 1].add(y)
+            top = max(top, r + 1)
+    return kept
+
+
+def _find(parent, x):
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+def tree_packing(G, k):
+    """
+    Try to pack k edge-disjoint spanning trees of G greedily; returns the k edge
+    lists, or None when the greedy packing gets stuck (which proves nothing).
+
+    Vertices of degree exactly k must be a leaf of every tree (and no packing
+    exists when two of them are adjacent), so the trees are grown on the other
+    vertices: one pass over the edges offers each edge to the trees in turn,
+    starting from the next one, and the first whose components it joins takes
+    it. Each leaf vertex then hangs one of its edges on each tree.
+    """
+    nodes = list(G.nodes())
+    leaves = {v for v in nodes if G.degree(v) == k}
+    if any(w in leaves for v in leaves for w in G.neighbors(v)):
+        return None
+    core = [v for v in nodes if v not in leaves]
+    parents = [{v: v for v in core} for _ in range(k)]
+    trees = [[] for _ in range(k)]
+    full = 0
+    turn = 0
+    for u, v in G.edges():
+        if u in leaves or v in leaves:
+            continue
+        for i in range(turn, turn + k):
+            i %= k
+            ru, rv = _find(parents[i], u), _find(parents[i], v)
+            if ru != rv:
+                parents[i][ru] = rv
+                trees[i].append((u, v))
+                full += len(trees[i]) == len(core) - 1
+                turn = i + 1
+                break
+        if full == k:
+            break
+    if full < k:
+        return None
+    for v in leaves:
+        for tree, w in zip(trees, G.neighbors(v)):
+            tree.append((v, w))
+    return trees
+
+
+def is_tree_packing(G, trees):
+    """
+    Check that `trees` are edge-disjoint spanning trees of G in near-linear time.
+    Each one crosses every cut, so k of them prove lambda(G) >= k.
+    """
+    nodes = list(G.nodes())
+    used = set()
+    for tree in trees:
+        if len(tree) != len(nodes) - 1:
+            return False
+        parent = {v: v for v in nodes}
+        for u, v in tree:
+            edge = frozenset((u, v))
+            if edge in used or u not in parent or v not in parent or not G.has_edge(u, v):
+                return False
+            used.add(edge)
+            ru, rv = _find(parent, u), _find(parent, v)
+            if ru == rv:
+                return False
+            parent[ru] = rv
+    return True
+
+
+def certificate_graph(G, k):
+    """Sparse k-certificate of G as a graph of the same type, on the same vertex set."""
+    edges = sparse_certificate(G, k)
+    if isinstance(G, CompactGraph):
+        return CompactGraph.from_edges(edges, nodes=G.nodes())
+    H = nx.Graph()
+    H.add_nodes_from(G.nodes())
+    H.add_edges_from(edges)
+    return H
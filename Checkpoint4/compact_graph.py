@@ -0,0 +1,312 @@
+import networkx as nx
+import numpy as np
+
+# Rows are also kept as bitsets when the graph is at least this dense (and small enough)
+BITSET_DENSITY = 0.25
+BITSET_MAX_NODES = 1 << 14
+
+
+class CompactGraph:
+    """
+    Undirected simple graph stored as CSR arrays instead of networkx dict-of-dicts.
+
+    The CSR part (indptr/indices, sorted rows) is immutable and shared by every
+    snapshot. Edges inserted later, which in the augmentation pipeline are only a
+    handful, live in a small per-snapshot overlay, so copy() costs O(inserted edges)
+    rather than O(m). Dense graphs additionally keep one Python int bitset per row
+    for O(1) adjacency tests.
+
+    The methods mirror the part of the networkx Graph API the pipeline uses, so the
+    stages in augmentation.py run on either type. Views derived from the whole
+    graph (merged CSR arrays, index adjacency, networkx adapter) are built once
+    and kept until the next insertion.
+    """
+
+    __slots__ = ("_labels", "_index", "_indptr", "_indices", "_bits", "_extra", "_m", "_owns_index",
+                 "_derived")
+
+    def __init__(self, labels, indptr, indices, bits=None, extra=None, num_edges=None, index=None):
+        # Vertices 0..n-1 keep a range and an implicit index, so loading a large
+        # graph allocates no per-vertex Python objects
+        if isinstance(labels, range) and labels.start == 0 and labels.step == 1:
+            self._labels = labels
+            default_index = _RangeIndex(len(labels))
+        else:
+            self._labels = tuple(labels)
+            default_index = {u: i for i, u in enumerate(self._labels)}
+        self._index = default_index if index is None else index
+        self._indptr = indptr
+        self._indices = indices
+        self._bits = bits
+        self._extra = {} if extra is None else extra
+        self._m = len(indices) // 2 if num_edges is None else num_edges
+        self._owns_index = index is None
+        self._derived = {}
+
+    def _memo(self, name, compute):
+        if name not in self._derived:
+            self._derived[name] = compute()
+        return self._derived[name]
+
+    # ---- construction and adapters ----
+
+    @classmethod
+    def from_edges(cls, edges, nodes=None, bitset=None):
+        """
+        Build from an iterable of (u, v) pairs. Vertex ids are numbered in first-seen
+        order, self-loops are dropped and duplicate edges are merged.
+        """
+        labels = [] if nodes is None else list(nodes)
+        index = {u: i for i, u in enumerate(labels)}
+        src, dst = [], []
+        for u, v in edges:
+            for w in (u, v):
+                if w not in index:
+                    index[w] = len(labels)
+                    labels.append(w)
+            src.append(index[u])
+            dst.append(index[v])
+        return cls.from_index_arrays(labels, np.asarray(src, dtype=np.int64),
+                                     np.asarray(dst, dtype=np.int64), bitset=bitset)
+
+    @classmethod
+    def from_index_arrays(cls, labels, src, dst, bitset=None):
+        """Build from parallel arrays of endpoint indices into `labels`."""
+        n = len(labels)
+        keep = src != dst
+        lo = np.minimum(src[keep], dst[keep])
+        hi = np.maximum(src[keep], dst[keep])
+        width = max(n, 1)
+        keys = np.sort(lo * width + hi)
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))[:len(keys)]]
+        lo, hi = keys // width, keys % width
+
+        # Both directions sorted by (row, col) through one integer key
+        both = np.sort(np.concatenate([lo * width + hi, hi * width + lo]))
+        rows = both // width
+        indices = (both % width).astype(np.int64)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+        bits = None
+        m = len(keys)
+        density = 2 * m / (n * (n - 1)) if n > 1 else 0
+        if bitset or (bitset is None and density >= BITSET_DENSITY and n <= BITSET_MAX_NODES):
+            bits = _row_bitsets(n, indptr, indices)
+        return cls(labels, indptr, indices, bits=bits, num_edges=m)
+
+    @classmethod
+    def from_networkx(cls, G, bitset=None):
+        return cls.from_edges(G.edges(), nodes=G.nodes(), bitset=bitset)
+
+    def csr(self):
+        """(labels, indptr, indices) with inserted edges merged into the arrays."""
+        if not self._extra and len(self._indptr) == len(self._labels) + 1:
+            return self._labels, self._indptr, self._indices
+        return self._labels, *self._memo("csr", self._merged_arrays)
+
+    def _merged_arrays(self):
+        rows = np.repeat(np.arange(len(self._indptr) - 1), np.diff(self._indptr))
+        extra = [(i, j) for i, row in self._extra.items() for j in row]
+        src = np.concatenate([rows, np.array([i for i, _ in extra], dtype=np.int64)])
+        dst = np.concatenate([self._indices, np.array([j for _, j in extra], dtype=np.int64)])
+        merged = CompactGraph.from_index_arrays(self._labels, src.astype(np.int64), dst.astype(np.int64),
+                                                bitset=False)
+        return merged._indptr, merged._indices
+
+    def adjacency(self):
+        """
+        Read-only list of {neighbour index: 1} rows in vertex-index order, the
+        input of the MA-ordering cut search, built from the CSR arrays.
+        """
+        def compute():
+            _, indptr, indices = self.csr()
+            bounds = indptr.tolist()
+            targets = indices.tolist()
+            return [dict.fromkeys(targets[bounds[i]:bounds[i + 1]], 1) for i in range(len(self._labels))]
+        return self._memo("adjacency", compute)
+
+    def edge_pairs(self):
+        """Every edge once as a (label, label) pair, read off the CSR arrays."""
+        labels, indptr, indices = self.csr()
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        upper = indices > rows
+        src, dst = rows[upper].tolist(), indices[upper].tolist()
+        if isinstance(labels, range):
+            return list(zip(src, dst))
+        return [(labels[i], labels[j]) for i, j in zip(src, dst)]
+
+    def to_networkx(self):
+        """A new, mutable networkx copy."""
+        G = nx.Graph()
+        G.add_nodes_from(self._labels)
+        G.add_edges_from(self.edge_pairs())
+        return G
+
+    def networkx_view(self):
+        """Frozen networkx copy, converted once and shared until the next insertion."""
+        return self._memo("networkx", lambda: nx.freeze(self.to_networkx()))
+
+    def copy(self):
+        """Snapshot sharing the CSR arrays; only the overlay of inserted edges is duplicated."""
+        clone = CompactGraph(self._labels, self._indptr, self._indices, bits=self._bits,
+                             extra={i: set(row) for i, row in self._extra.items()},
+                             num_edges=self._m, index=self._index)
+        clone._derived = dict(self._derived)
+        return clone
+
+    # ---- networkx-style queries ----
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __contains__(self, u):
+        return u in self._index
+
+    def __getitem__(self, u):
+        return set(self.neighbors(u))
+
+    def nodes(self):
+        return self._labels
+
+    def number_of_nodes(self):
+        return len(self._labels)
+
+    def number_of_edges(self):
+        return self._m
+
+    def has_node(self, u):
+        return u in self._index
+
+    def _row(self, i):
+        if i + 1 < len(self._indptr):
+            return self._indices[self._indptr[i]:self._indptr[i + 1]]
+        return self._indices[:0]
+
+    def has_edge(self, u, v):
+        i = self._index.get(u)
+        j = self._index.get(v)
+        if i is None or j is None:
+            return False
+        if j in self._extra.get(i, ()):
+            return True
+        if self._bits is not None and i < len(self._bits):
+            return bool((self._bits[i] >> j) & 1)
+        row = self._row(i)
+        pos = np.searchsorted(row, j)
+        return pos < len(row) and row[pos] == j
+
+    def neighbors(self, u):
+        i = self._index[u]
+        labels = self._labels
+        for j in self._row(i).tolist():
+            yield labels[j]
+        for j in self._extra.get(i, ()):
+            yield labels[j]
+
+    def _degree(self, i):
+        base = int(self._indptr[i + 1] - self._indptr[i]) if i + 1 < len(self._indptr) else 0
+        return base + len(self._extra.get(i, ()))
+
+    def degree(self, u=None):
+        """Degree of u, or (vertex, degree) pairs for every vertex like G.degree()."""
+        if u is not None:
+            return self._degree(self._index[u])
+        return [(label, self._degree(i)) for i, label in enumerate(self._labels)]
+
+    def degree_array(self):
+        """Degrees of all vertices as a NumPy array in vertex-index order."""
+        deg = np.zeros(len(self._labels), dtype=np.int64)
+        deg[:len(self._indptr) - 1] = np.diff(self._indptr)
+        for i, row in self._extra.items():
+            deg[i] += len(row)
+        return deg
+
+    def edges(self):
+        labels = self._labels
+        for i in range(len(self._indptr) - 1):
+            for j in self._row(i).tolist():
+                if j > i:
+                    yield (labels[i], labels[j])
+        for i, row in self._extra.items():
+            for j in row:
+                if j > i:
+                    yield (labels[i], labels[j])
+
+    def subgraph(self, vertices):
+        """Induced subgraph on `vertices` as a new CompactGraph."""
+        keep = [u for u in vertices if u in self._index]
+        inside = set(keep)
+        edges = ((u, v) for u in keep for v in self.neighbors(u) if v in inside)
+        return CompactGraph.from_edges(edges, nodes=keep)
+
+    # ---- mutation (overlay only) ----
+
+    def add_node(self, u):
+        if u in self._index:
+            return
+        if not self._owns_index:
+            self._index = dict(self._index)
+            self._owns_index = True
+        self._index[u] = len(self._labels)
+        self._labels = tuple(self._labels) + (u,)
+        self._derived = {}
+
+    def add_edge(self, u, v):
+        if u == v or self.has_edge(u, v):
+            return
+        self.add_node(u)
+        self.add_node(v)
+        i, j = self._index[u], self._index[v]
+        self._extra.setdefault(i, set()).add(j)
+        self._extra.setdefault(j, set()).add(i)
+        self._m += 1
+        self._derived = {}
+
+    def add_edges_from(self, edges):
+        for u, v in edges:
+            self.add_edge(u, v)
+
+
+class _RangeIndex:
+    """Vertex -> position map for the labels 0..n-1, without storing it."""
+
+    __slots__ = ("_n",)
+
+    def __init__(self, n):
+        self._n = n
+
+    def __contains__(self, u):
+        return isinstance(u, (int, np.integer)) and 0 <= u < self._n
+
+    def get(self, u, default=None):
+        return int(u) if u in self else default
+
+    def __getitem__(self, u):
+        if u not in self:
+            raise KeyError(u)
+        return int(u)
+
+    def keys(self):
+        return range(self._n)
+
+
+def _row_bitsets(n, indptr, indices):
+    """One Python int per row with bit j set when j is a neighbour."""
+    bits = []
+    for i in range(n):
+        row = np.zeros(n, dtype=bool)
+        row[indices[indptr[i]:indptr[i + 1]]] = True
+        bits.append(int.from_bytes(np.packbits(row, bitorder="little").tobytes(), "little"))
+    return bits
+
+
+def as_networkx(G):
+    """
+    Return G itself if it is a networkx graph, otherwise its cached, frozen
+    networkx adapter (copy it before changing it).
+    """
+    return G.networkx_view() if isinstance(G, CompactGraph) else G
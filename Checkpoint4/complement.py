@@ -0,0 +1,83 @@
+import random
+
+
+class ComplementView:
+    """
+    Read-only complement of G restricted to `nodes`, answered on the fly.
+
+    Nothing is allocated per complement edge: u and v are adjacent in the view
+    exactly when they are distinct members of `nodes` and not adjacent in G,
+    so every query goes straight to G's adjacency.
+    """
+
+    def __init__(self, G, nodes=None):
+        self._graph = G
+        self._nodes = list(G.nodes()) if nodes is None else list(nodes)
+        self._node_set = set(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, u):
+        return u in self._node_set
+
+    def nodes(self):
+        return list(self._nodes)
+
+    def number_of_nodes(self):
+        return len(self._nodes)
+
+    def has_node(self, u):
+        return u in self._node_set
+
+    def has_edge(self, u, v):
+        return (
+            u != v
+            and u in self._node_set
+            and v in self._node_set
+            and not self._graph.has_edge(u, v)
+        )
+
+    def neighbors(self, u):
+        """Iterate over the complement neighbours of u in node order."""
+        adj = self._graph[u]
+        for v in self._nodes:
+            if v != u and v not in adj:
+                yield v
+
+    def degree(self, u):
+        inside = sum(1 for v in self._graph.neighbors(u) if v in self._node_set)
+        return len(self._nodes) - 1 - inside
+
+    def edges(self):
+        """Iterate over complement edges (u, v) with u before v in node order."""
+        for i, u in enumerate(self._nodes):
+            adj = self._graph[u]
+            for v in self._nodes[i + 1:]:
+                if v not in adj:
+                    yield (u, v)
+
+    def number_of_edges(self):
+        n = len(self._nodes)
+        inside = sum(
+            1 for u in self._nodes for v in self._graph.neighbors(u) if v in self._node_set
+        ) // 2
+        return n * (n - 1) // 2 - inside
+
+    def random_edges(self, rng=None):
+        """
+        Iterate over every complement edge once in a randomised order.
+        Only one vertex's candidate list is held in memory at a time.
+        """
+        rng = random if rng is None else rng
+        order = list(self._nodes)
+        rng.shuffle(order)
+        position = {u: i for i, u in enumerate(order)}
+        for u in order:
+            candidates = [v for v in self.neighbors(u) if position[v] > position[u]]
+            rng.shuffle(candidates)
+            for v in candidates:
+                yield (u, v)
@@ -1,6 +1,357 @@
-from itertools import combinations
-import networkx as nx
+import heapq
+import math
 import random
-import unittest
-def is_k_plus_1_edge_connected(G, k):
-    return nx.edge_connectivity(G) >= k + 1
\ No newline at end of file
+
+import networkx as nx
+from compact_graph import CompactGraph, as_networkx
+from tracing import checkpoint, count
+
+BACKENDS = ("auto", "flow", "stoer_wagner", "nagamochi_ibaraki", "karger_stein")
+
+# Graphs at least this dense always go to MA orderings; below it max-flow is
+# only competitive on near-regular graphs
+AUTO_DENSE = 0.2
+
+
+def _is_weighted(G):
+    """True for graphs whose 'weight' attribute counts parallel edges (G.graph["weighted"])."""
+    return bool(getattr(G, "graph", {}).get("weighted"))
+
+
+def _weighted_adjacency(G):
+    """
+    Index the vertices of G and return (nodes, adjacency as a list of {index: multiplicity}).
+    The 'weight' edge attribute is read as the edge multiplicity only on graphs
+    marked G.graph["weighted"] (contracted graphs); other weights are ignored.
+    A CompactGraph hands out its own adjacency, built once from its CSR arrays.
+    """
+    if isinstance(G, CompactGraph):
+        return list(G.nodes()), G.adjacency()
+    nodes = list(G.nodes())
+    index = {u: i for i, u in enumerate(nodes)}
+    adj = [dict() for _ in nodes]
+    weighted = _is_weighted(G)
+    for u in nodes:
+        i = index[u]
+        if weighted:
+            for v, data in G.adj[u].items():
+                j = index[v]
+                if i != j:
+                    adj[i][j] = data.get("weight", 1)
+        else:
+            for v in G.neighbors(u):
+                j = index[v]
+                if i != j:
+                    adj[i][j] = 1
+    return nodes, adj
+
+
+def _ma_ordering_min_cut(adj, threshold=None, return_side=False):
+    """
+    Nagamochi-Ibaraki minimum cut on a weighted adjacency list.
+
+    Each phase computes a maximum-adjacency ordering. An edge (x, y) whose
+    attachment value q reaches the current bound satisfies lambda(x, y) >= q, so all
+    such edges are contracted at once, together with the last two vertices of the
+    ordering. With a threshold t the search stops as soon as a cut below t is seen,
+    and edges with q >= t are contracted too, since only cuts below t matter.
+
+    With return_side=True the result is (value, side), where side lists the vertex
+    indices on one shore of a cut of that value (None when the graph has one vertex).
+    """
+    adj = [dict(row) for row in adj]
+    if len(adj) < 2:
+        return (0, None) if return_side else 0
+    members = {v: [v] for v in range(len(adj))}
+    degrees = [sum(row.values()) for row in adj]
+    best = min(degrees)
+    best_side = [degrees.index(best)]
+    alive = list(range(len(adj)))
+    parent = list(range(len(adj)))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def result():
+        return (best, best_side) if return_side else best
+
+    while len(alive) > 1:
+        checkpoint()
+        if threshold is not None and best < threshold:
+            return result()
+        limit = best if threshold is None else min(best, threshold)
+
+        key = {v: 0 for v in alive}
+        scanned = set()
+        order = []
+        merge = []
+        heap = [(0, alive[0])]
+        while heap:
+            neg_key, x = heapq.heappop(heap)
+            if x in scanned or -neg_key != key[x]:
+                continue
+            scanned.add(x)
+            order.append(x)
+            for y, w in adj[x].items():
+                if y not in scanned:
+                    key[y] += w
+                    heapq.heappush(heap, (-key[y], y))
+                    if key[y] >= limit:
+                        merge.append((x, y))
+        if len(order) < len(alive):
+            best = 0
+            best_side = [v for x in order for v in members[x]]
+            return result()
+
+        s, t = order[-2], order[-1]
+        if key[t] < best:
+            best, best_side = key[t], list(members[t])
+        merge.append((s, t))
+        for x, y in merge:
+            rx, ry = find(x), find(y)
+            if rx != ry:
+                if len(members[rx]) < len(members[ry]):
+                    rx, ry = ry, rx
+                parent[ry] = rx
+                members[rx].extend(members.pop(ry))
+
+        contracted = {}
+        for x in alive:
+            rx = find(x)
+            row = contracted.setdefault(rx, {})
+            for y, w in adj[x].items():
+                ry = find(y)
+                if ry != rx:
+                    row[ry] = row.get(ry, 0) + w
+        for x, row in contracted.items():
+            adj[x] = row
+            if len(contracted) > 1 and sum(row.values()) < best:
+                best, best_side = sum(row.values()), list(members[x])
+        alive = list(contracted)
+    return result()
+
+
+def _is_connected(adj):
+    if not adj:
+        return True
+    seen = {0}
+    stack = [0]
+    while stack:
+        x = stack.pop()
+        for y in adj[x]:
+            if y not in seen:
+                seen.add(y)
+                stack.append(y)
+    return len(seen) == len(adj)
+
+
+def _karger_stein_min_cut(adj, trials=None, seed=None):
+    """
+    Karger-Stein recursive random contraction.
+    Monte Carlo: the result is the value of a real cut and equals the minimum
+    cut with high probability; more trials raise the probability.
+    """
+    n = len(adj)
+    if n < 2:
+        return 0
+    if not _is_connected(adj):
+        return 0
+    rng = random.Random(seed)
+    edges = [(i, j) for i, row in enumerate(adj) for j, w in row.items() if i < j for _ in range(w)]
+
+    def contract(edges, n, target):
+        parent = list(range(n))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        order = edges[:]
+        rng.shuffle(order)
+        remaining = n
+        for x, y in order:
+            if remaining <= target:
+                break
+            rx, ry = find(x), find(y)
+            if rx != ry:
+                parent[ry] = rx
+                remaining -= 1
+        label = {}
+        for v in range(n):
+            label.setdefault(find(v), len(label))
+        kept = [(label[find(x)], label[find(y)]) for x, y in edges if find(x) != find(y)]
+        return kept, len(label)
+
+    def recurse(edges, n):
+        if n <= 6:
+            small = [dict() for _ in range(n)]
+            for x, y in edges:
+                small[x][y] = small[x].get(y, 0) + 1
+                small[y][x] = small[y].get(x, 0) + 1
+            return _ma_ordering_min_cut(small)
+        target = int(math.ceil(1 + n / math.sqrt(2)))
+        return min(recurse(*contract(edges, n, target)) for _ in range(2))
+
+    if trials is None:
+        trials = max(1, int(math.ceil(math.log2(n))))
+    return min(recurse(edges, n) for _ in range(trials))
+
+
+def weighted_degree(G):
+    """(vertex, degree) pairs, counting the 'weight' multiplicities of weighted graphs."""
+    if _is_weighted(G):
+        return G.degree(weight="weight")
+    return G.degree()
+
+
+def find_cut_below(G, t):
+    """
+    Return one shore of a cut of G with value below t, or None when lambda(G) >= t.
+    Weighted graphs (G.graph["weighted"]) are supported through the 'weight' edge attribute.
+    """
+    checkpoint()
+    count("cut_searches")
+    nodes, adj = _weighted_adjacency(G)
+    value, side = _ma_ordering_min_cut(adj, threshold=t, return_side=True)
+    if side is None or value >= t:
+        return None
+    return [nodes[i] for i in side]
+
+
+def choose_backend(G):
+    """
+    Pick an exact backend from n, m and density.
+    MA orderings win everywhere except on sparse near-regular graphs, where few
+    edges reach the contraction bound and networkx max-flow is as fast.
+    """
+    if isinstance(G, CompactGraph) or _is_weighted(G):
+        return "nagamochi_ibaraki"
+    n = G.number_of_nodes()
+    m = G.number_of_edges()
+    density = 2 * m / (n * (n - 1)) if n > 1 else 0
+    if density >= AUTO_DENSE:
+        return "nagamochi_ibaraki"
+    degrees = [d for _, d in G.degree()]
+    if max(degrees) <= 2 * max(min(degrees), 1) and n > 200:
+        return "flow"
+    return "nagamochi_ibaraki"
+
+
+def compute_edge_connectivity(G, backend="auto", **options):
+    """
+    Edge-connectivity of G with a selectable backend.
+
+    Backends: "flow" (networkx max-flow), "stoer_wagner", "nagamochi_ibaraki"
+    (MA orderings, runs natively on CompactGraph), "karger_stein" (randomized,
+    accepts `trials` and `seed`), or "auto" to choose from the graph's size.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown connectivity backend: {backend}")
+    checkpoint()
+    count("connectivity_checks")
+    if G.number_of_nodes() < 2:
+        return 0
+    if backend == "auto":
+        backend = choose_backend(G)
+    if backend == "flow":
+        return nx.edge_connectivity(as_networkx(G))
+    if backend == "stoer_wagner":
+        H = as_networkx(G)
+        if not nx.is_connected(H):
+            return 0
+        cut_value, _ = nx.stoer_wagner(H)
+        return cut_value
+    _, adj = _weighted_adjacency(G)
+    if backend == "karger_stein":
+        return _karger_stein_min_cut(adj, **options)
+    return _ma_ordering_min_cut(adj)
+
+
+def edge_connectivity_at_least(G, t, backend="auto"):
+    """
+    Answer "is lambda(G) >= t?" without computing lambda exactly when possible:
+    a vertex of degree below t answers no immediately, the flow backend stops
+    its max-flows at t, and MA orderings stop at the first cut below t.
+    """
+    if t <= 0:
+        return True
+    checkpoint()
+    count("connectivity_checks")
+    if G.number_of_nodes() < 2:
+        return False
+    if any(d < t for _, d in weighted_degree(G)):
+        return False
+    if backend == "auto":
+        # MA orderings with early exit beat cutoff max-flows at every size
+        backend = "nagamochi_ibaraki"
+    if backend == "flow":
+        return nx.edge_connectivity(as_networkx(G), cutoff=t) >= t
+    if backend == "nagamochi_ibaraki":
+        _, adj = _weighted_adjacency(G)
+        return _ma_ordering_min_cut(adj, threshold=t) >= t
+    return compute_edge_connectivity(G, backend=backend) >= t
+
+
+def local_cut_below(G, u, v, t, capacity=None):
+    """
+    Look for fewer than t edge-disjoint u-v paths with at most t BFS augmenting
+    paths over unit capacities (weighted graphs use the 'weight' multiplicity,
+    and `capacity` names another edge attribute to read instead), so the cost
+    is O(t * m).
+
+    Returns None when t paths exist. Otherwise returns (source_side, sink_side):
+    the vertices u still reaches in the residual graph and the vertices that
+    still reach v. Every minimum u-v cut has the first set on u's side and the
+    second on v's side.
+    """
+    attribute = "weight" if capacity is None and _is_weighted(G) else capacity
+    flow = {}
+
+    def residual(a, b):
+        limit = G[a][b].get(attribute, 1) if attribute else 1
+        return limit - flow.get((a, b), 0)
+
+    def reach(start, forward, goal=None):
+        seen = {start: None}
+        queue = [start]
+        for a in queue:
+            if goal in seen:
+                break
+            for b in G.neighbors(a):
+                if b not in seen and (residual(a, b) if forward else residual(b, a)) > 0:
+                    seen[b] = a
+                    queue.append(b)
+        return seen
+
+    for _ in range(t):
+        parent = reach(u, True, v)
+        if v not in parent:
+            return set(parent), set(reach(v, False))
+        b = v
+        while parent[b] is not None:
+            a = parent[b]
+            flow[a, b] = flow.get((a, b), 0) + 1
+            flow[b, a] = flow.get((b, a), 0) - 1
+            b = a
+    return None
+
+
+def local_edge_connectivity_at_least(G, u, v, t):
+    """Answer "do at least t edge-disjoint paths join u and v?" in O(t * m)."""
+    if t <= 0 or u == v:
+        return True
+    checkpoint()
+    count("connectivity_checks")
+    degree = (lambda w: G.degree(w, weight="weight")) if _is_weighted(G) else G.degree
+    if min(degree(u), degree(v)) < t:
+        return False
+    return local_cut_below(G, u, v, t) is None
+
+
+def is_k_plus_1_edge_connected(G, k, backend="auto"):
+    return edge_connectivity_at_least(G, k + 1, backend=backend)
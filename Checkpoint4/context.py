@@ -0,0 +1,102 @@
+from complement import ComplementView
+from connectivity import compute_edge_connectivity
+from contraction import augment_contracted, contract_components
+from graph_utils import get_vertices_of_degree_k
+from matching import compute_maximum_matching
+from min_cuts import MinCutStructure
+
+
+class AugmentationContext:
+    """
+    Lazily computed, memoised artifacts of one graph shared by the augmentation stages.
+
+    Every artifact (connectivity, degree-k vertices, complement views, matching,
+    minimum cuts, the exact engine's answer) is computed on first use and cached
+    against the graph's version counter. Adding edges through the context bumps
+    the version, so the next access recomputes; the last matching is kept as the
+    warm start for the new one.
+    """
+
+    _DEPENDS_ON_K = ("vertices_k", "complement_k", "matching", "exact")
+
+    def __init__(self, G, k, workers=1):
+        self.graph = G
+        self.k = k
+        # Processes the greedy fallbacks may use to check candidate edges (None: all cores)
+        self.workers = workers
+        self.version = 0
+        self._cache = {}
+        self._cache_version = 0
+        self._previous_matching = None
+
+    def _memo(self, name, compute):
+        if self._cache_version != self.version:
+            if "matching" in self._cache:
+                self._previous_matching = self._cache["matching"]
+            self._cache = {}
+            self._cache_version = self.version
+        if name not in self._cache:
+            self._cache[name] = compute()
+        return self._cache[name]
+
+    def invalidate(self):
+        """Mark every cached artifact stale, e.g. after the graph was changed directly."""
+        self.version += 1
+
+    def add_edge(self, u, v):
+        self.graph.add_edge(u, v)
+        self.invalidate()
+
+    def add_edges_from(self, edges):
+        self.graph.add_edges_from(edges)
+        self.invalidate()
+
+    def set_k(self, k):
+        """Retarget the context; only the artifacts that depend on k are recomputed."""
+        if k != self.k:
+            self.k = k
+            if self._cache_version == self.version:
+                if "matching" in self._cache:
+                    self._previous_matching = self._cache["matching"]
+                for name in self._DEPENDS_ON_K:
+                    self._cache.pop(name, None)
+
+    @property
+    def connectivity(self):
+        if "min_cuts" in self._cache and self._cache_version == self.version:
+            return self._cache["min_cuts"].connectivity
+        return self._memo("connectivity", lambda: compute_edge_connectivity(self.graph))
+
+    @property
+    def vertices_k(self):
+        return self._memo("vertices_k", lambda: get_vertices_of_degree_k(self.graph, self.k))
+
+    @property
+    def complement(self):
+        return self._memo("complement", lambda: ComplementView(self.graph))
+
+    @property
+    def complement_k(self):
+        return self._memo("complement_k", lambda: ComplementView(self.graph, self.vertices_k))
+
+    @property
+    def matching(self):
+        return self._memo(
+            "matching",
+            lambda: compute_maximum_matching(self.complement_k, initial_matching=self._previous_matching),
+        )
+
+    @property
+    def min_cuts(self):
+        return self._memo("min_cuts", lambda: MinCutStructure(self.graph))
+
+    @property
+    def exact(self):
+        """
+        (G_aug, new_edges) of the exact k -> k+1 engine on the contracted graph,
+        or None when it is blocked; stages that fall back after it reuse the answer.
+        """
+        def compute():
+            H, members = contract_components(self.graph, self.k)
+            return augment_contracted(self.graph, self.k, H, members, self.connectivity)
+        return self._memo("exact", compute)
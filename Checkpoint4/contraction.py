@@ -0,0 +1,164 @@
+import networkx as nx
+from connectivity import compute_edge_connectivity, edge_connectivity_at_least, find_cut_below
+from exact_augmentation import augment_by_one
+from tracing import count, logger, timed
+
+
+def _peel_low_degree(G, vertices, k):
+    """
+    Split off vertices whose degree inside `vertices` is below k, repeatedly.
+    Each of them forms a part on its own; the rest is returned for cut splitting.
+    """
+    inside = set(vertices)
+    degree = {u: sum(1 for v in G.neighbors(u) if v in inside) for u in inside}
+    queue = [u for u, d in degree.items() if d < k]
+    peeled = []
+    while queue:
+        u = queue.pop()
+        if u not in inside:
+            continue
+        inside.discard(u)
+        peeled.append(u)
+        for v in G.neighbors(u):
+            if v in inside:
+                degree[v] -= 1
+                if degree[v] == k - 1:
+                    queue.append(v)
+    return peeled, [u for u in vertices if u in inside]
+
+
+def edge_connected_subgraphs(G, k):
+    """
+    Vertex sets of the maximal k-edge-connected induced subgraphs of G.
+
+    A cut of value below k inside a set can never be crossed by a k-edge-connected
+    subgraph, so the sets are split along such cuts until none is left. Vertices of
+    degree below k are peeled off first without any cut computation.
+    """
+    parts = []
+    pending = [list(G.nodes())]
+    while pending:
+        vertices = pending.pop()
+        peeled, rest = _peel_low_degree(G, vertices, k)
+        parts.extend([u] for u in peeled)
+        if len(rest) <= 1:
+            parts.extend([u] for u in rest)
+            continue
+        side = find_cut_below(G.subgraph(rest), k)
+        if side is None:
+            parts.append(rest)
+        else:
+            side_set = set(side)
+            pending.append(side)
+            pending.append([u for u in rest if u not in side_set])
+    return parts
+
+
+@timed("contraction")
+def contract_components(G, k):
+    """
+    Contract every maximal (k+1)-edge-connected subgraph of G to a super-vertex.
+
+    Returns (H, members): H is a weighted graph whose 'weight' counts the parallel
+    edges between two parts, and members maps each super-vertex (the first vertex
+    of its part) to the part's vertices. A cut of value at most k cannot split a
+    (k+1)-edge-connected subgraph, so these cuts are exactly the cuts of H.
+    """
+    H = nx.Graph(weighted=True)
+    members = {}
+    owner = {}
+    for part in edge_connected_subgraphs(G, k + 1):
+        rep = part[0]
+        members[rep] = part
+        H.add_node(rep)
+        for u in part:
+            owner[u] = rep
+    for u, v in G.edges():
+        a, b = owner[u], owner[v]
+        if a == b:
+            continue
+        if H.has_edge(a, b):
+            H[a][b]["weight"] += 1
+        else:
+            H.add_edge(a, b, weight=1)
+    return H, members
+
+
+def _merge_pairs(H, pairs):
+    """
+    H with the two ends of every new super-edge merged. Each new edge lifts the
+    local connectivity of its ends from lambda to lambda + 1, so no cut below
+    lambda + 1 separates them and the merged graph has exactly the cuts below
+    lambda + 1 of H plus the edges, on far fewer vertices (a single vertex when
+    none is left).
+    """
+    parent = {u: u for u in H}
+
+    def find(u):
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        return u
+
+    for a, b in pairs:
+        parent[find(a)] = find(b)
+    merged = nx.Graph(weighted=True)
+    merged.add_nodes_from(find(u) for u in H)
+    for u, v, w in H.edges(data="weight", default=1):
+        a, b = find(u), find(v)
+        if a == b:
+            continue
+        if merged.has_edge(a, b):
+            merged[a][b]["weight"] += w
+        else:
+            merged.add_edge(a, b, weight=w)
+    return merged
+
+
+@timed("contracted_augmentation")
+def augment_contracted(G, k, H, members, lam=None):
+    """
+    Raise the connectivity of G from k to k+1 by working on its contracted graph H.
+
+    The exact k -> k+1 engine runs on H, where two super-vertices may be joined as
+    long as some concrete pair between them is still free, and every chosen
+    super-edge is mapped back to such a pair (lowest degrees first).
+    The super-edges are checked to make H (k+1)-edge-connected before they are
+    returned (see _merge_pairs). `lam` is lambda(G) when the caller knows it (it equals lambda(H)
+    whenever it is at most k).
+
+    Returns (G_aug, new_edges), or None when lambda(H) != k or the engine is blocked.
+    """
+    lam = compute_edge_connectivity(H) if lam is None else lam
+    if lam != k or H.number_of_nodes() < 2:
+        return None
+    used = set()
+
+    def concrete_pair(a, b):
+        for x in sorted(members[a], key=G.degree):
+            for y in sorted(members[b], key=G.degree):
+                if not G.has_edge(x, y) and frozenset((x, y)) not in used:
+                    return x, y
+        return None
+
+    logger.debug("Contracted %s vertices into %s", G.number_of_nodes(), H.number_of_nodes())
+    pairs = augment_by_one(H, lam, room=lambda a, b: len(members[a]) * len(members[b]))
+    if pairs is None:
+        return None
+    merged = _merge_pairs(H, pairs)
+    if merged.number_of_nodes() > 1 and not edge_connectivity_at_least(merged, lam + 1):
+        logger.warning("Exact augmentation result failed verification; discarding it.")
+        count("exact.rejected")
+        return None
+    new_edges = []
+    for a, b in pairs:
+        pair = concrete_pair(a, b)
+        if pair is None:
+            return None
+        used.add(frozenset(pair))
+        new_edges.append(pair)
+    count("candidate_edges", len(new_edges))
+    G_aug = G.copy()
+    G_aug.add_edges_from(new_edges)
+    logger.info("Connectivity increased to %s on the contracted graph with %s edges.", lam + 1, len(new_edges))
+    return G_aug, new_edges
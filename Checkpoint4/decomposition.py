@@ -0,0 +1,284 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from tracing import count, current_trace, logger, timed
+
+# Components are solved in worker processes only when the graph has this many edges
+PARALLEL_MIN_EDGES = 20000
+
+
+def connected_components(G):
+    """Vertex lists of the connected components of G, largest first."""
+    seen = set()
+    components = []
+    for s in G.nodes():
+        if s in seen:
+            continue
+        seen.add(s)
+        component = [s]
+        stack = [s]
+        while stack:
+            u = stack.pop()
+            for v in G.neighbors(u):
+                if v not in seen:
+                    seen.add(v)
+                    component.append(v)
+                    stack.append(v)
+        components.append(component)
+    components.sort(key=len, reverse=True)
+    return components
+
+
+def bridge_blocks(G):
+    """
+    The 2-edge-connected blocks of G and its bridges, in O(n + m).
+    Returns (blocks, block_of, bridges): vertex lists, a vertex -> block index map
+    and the list of bridge edges.
+    """
+    order = {}
+    low = {}
+    bridges = []
+    for root in G.nodes():
+        if root in order:
+            continue
+        order[root] = low[root] = len(order)
+        # (vertex, parent, neighbour iterator); the parent edge is skipped once
+        stack = [(root, None, iter(G.neighbors(root)))]
+        while stack:
+            u, parent, neighbours = stack[-1]
+            advanced = False
+            for v in neighbours:
+                if v == parent:
+                    parent = None
+                    stack[-1] = (u, parent, neighbours)
+                    continue
+                if v in order:
+                    low[u] = min(low[u], order[v])
+                else:
+                    order[v] = low[v] = len(order)
+                    stack.append((v, u, iter(G.neighbors(v))))
+                    advanced = True
+                    break
+            if advanced:
+                continue
+            stack.pop()
+            if stack:
+                p = stack[-1][0]
+                low[p] = min(low[p], low[u])
+                if low[u] > order[p]:
+                    bridges.append((p, u))
+
+    bridge_set = {frozenset(e) for e in bridges}
+    block_of = {}
+    blocks = []
+    for s in G.nodes():
+        if s in block_of:
+            continue
+        block_of[s] = len(blocks)
+        block = [s]
+        stack = [s]
+        while stack:
+            u = stack.pop()
+            for v in G.neighbors(u):
+                if v not in block_of and frozenset((u, v)) not in bridge_set:
+                    block_of[v] = len(blocks)
+                    block.append(v)
+                    stack.append(v)
+        blocks.append(block)
+    return blocks, block_of, bridges
+
+
+def _free_pair(G, X, Y, used):
+    """A non-adjacent, not yet used vertex pair between X and Y, lowest degrees first."""
+    for x in sorted(X, key=G.degree):
+        for y in sorted(Y, key=G.degree):
+            if x != y and not G.has_edge(x, y) and frozenset((x, y)) not in used:
+                return x, y
+    return None
+
+
+def join_path(G, components):
+    """c - 1 edges joining the components in a path (optimal for target 1)."""
+    return [(min(a, key=G.degree), min(b, key=G.degree)) for a, b in zip(components, components[1:])]
+
+
+def _leaf_slots(blocks, block_of, bridges):
+    """
+    Per tree of the bridge-block forest, its leaf blocks in DFS order; a block
+    without bridges is listed twice because it needs two new edges.
+    """
+    tree = {b: [] for b in range(len(blocks))}
+    for u, v in bridges:
+        a, b = block_of[u], block_of[v]
+        tree[a].append(b)
+        tree[b].append(a)
+    seen = set()
+    forest = []
+    for root in range(len(blocks)):
+        if root in seen:
+            continue
+        if not tree[root]:
+            seen.add(root)
+            forest.append([root, root])
+            continue
+        slots = []
+        seen.add(root)
+        stack = [root]
+        while stack:
+            b = stack.pop()
+            if len(tree[b]) == 1:
+                slots.append(b)
+            for c in reversed(tree[b]):
+                if c not in seen:
+                    seen.add(c)
+                    stack.append(c)
+        forest.append(slots)
+    return forest
+
+
+def bridge_augmentation(G):
+    """
+    Edges that make G 2-edge-connected, after Eswaran and Tarjan: with p leaf
+    blocks and q isolated blocks in the bridge-block forest, ceil(p/2) + q edges
+    are necessary and, up to pairs blocked by existing edges, sufficient.
+
+    The trees are first chained through one leaf each; on the resulting tree,
+    leaf i (in DFS order) is joined to leaf i + p/2, which crosses every bridge.
+    Every step is linear. Returns the edges, or None when existing edges block
+    the construction.
+    """
+    blocks, block_of, bridges = bridge_blocks(G)
+    if len(blocks) <= 1:
+        return []
+    used = set()
+    added = []
+
+    def join(a, b):
+        pair = _free_pair(G, blocks[a], blocks[b], used)
+        if pair is None:
+            return False
+        used.add(frozenset(pair))
+        added.append(pair)
+        return True
+
+    forest = _leaf_slots(blocks, block_of, bridges)
+    for left, right in zip(forest, forest[1:]):
+        if not join(left[-1], right[0]):
+            return None
+
+    H = G.copy()
+    H.add_edges_from(added)
+    blocks, block_of, bridges = bridge_blocks(H)
+    if len(blocks) > 1:
+        (leaves,) = _leaf_slots(blocks, block_of, bridges)
+        half = len(leaves) // 2
+        pairs = [(leaves[i], leaves[i + half]) for i in range(half)]
+        if len(leaves) % 2:
+            pairs.append((leaves[-1], leaves[0]))
+        for a, b in pairs:
+            pair = _free_pair(H, blocks[a], blocks[b], used)
+            if pair is None:
+                return None
+            used.add(frozenset(pair))
+            added.append(pair)
+
+    H = G.copy()
+    H.add_edges_from(added)
+    _, _, remaining = bridge_blocks(H)
+    if remaining or len(connected_components(H)) > 1:
+        return None
+    return added
+
+
+def join_cycle(components, target):
+    """
+    Edges joining (target)-edge-connected components so every cut between them
+    is crossed `target` times: ceil(target/2) edges between neighbours on a
+    cycle, or `target` edges when there are only two components.
+    """
+    if len(components) == 2:
+        arcs, width = [(components[0], components[1])], target
+    else:
+        arcs = list(zip(components, components[1:] + components[:1]))
+        width = (target + 1) // 2
+    return [(a[i % len(a)], b[i % len(b)]) for a, b in arcs for i in range(width)]
+
+
+def _solve_component(edges, target):
+    """
+    Raise one component to `target`; runs inline or in a worker process. Inline,
+    the work is recorded in the caller's trace (a worker has none).
+    """
+    from augmentation import augment_connectivity
+    from connectivity import compute_edge_connectivity
+    import networkx as nx
+
+    lam = compute_edge_connectivity(nx.Graph(edges))
+    if lam >= target:
+        return []
+    return augment_connectivity(edges, lam, target=target, trace=current_trace()).new_edges
+
+
+def _component_edges(G, part):
+    """Every edge inside `part` once."""
+    done = set()
+    edges = []
+    for u in part:
+        done.add(u)
+        edges.extend((u, v) for v in G.neighbors(u) if v not in done)
+    return edges
+
+
+def _solve_components(G, components, target, workers):
+    jobs = [_component_edges(G, part) for part in components]
+    workers = max(os.cpu_count() or 1, 1) if workers is None else workers
+    if workers > 1 and len(jobs) > 1 and G.number_of_edges() >= PARALLEL_MIN_EDGES:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_solve_component, jobs, [target] * len(jobs)))
+    else:
+        results = [_solve_component(edges, target) for edges in jobs]
+    return [edge for result in results for edge in result]
+
+
+@timed("decomposition")
+def decomposed_augmentation(G, target, workers=1):
+    """
+    Front end for graphs with connectivity 0 or 1, where the global stages would
+    pay full-graph flows for a problem that splits along components and bridges.
+
+    - target 1: join the components in a path.
+    - target 2: Eswaran-Tarjan over the bridge-block forest.
+    - target >= 3 with several components that can each reach the target on
+      their own: solve the components independently (in worker processes when
+      the graph is large), then join them with join_cycle.
+    - otherwise: bring the graph to 2 as above and leave the rest to the pipeline.
+
+    Returns the new edges (empty when G is connected and bridgeless).
+    """
+    if target <= 0 or G.number_of_nodes() < 2:
+        return []
+    components = connected_components(G)
+    if len(components) == 1:
+        if target == 1 or not bridge_blocks(G)[2]:
+            return []
+    count("components", len(components))
+
+    if target == 1:
+        edges = join_path(G, components)
+        logger.info("Joined %s components with %s edges", len(components), len(edges))
+        return edges
+
+    if target >= 3 and len(components) > 1 and all(len(c) > target for c in components):
+        edges = _solve_components(G, components, target, workers)
+        edges += join_cycle(components, target)
+        logger.info("Solved %s components independently and joined them, %s edges",
+                    len(components), len(edges))
+        return edges
+
+    edges = bridge_augmentation(G)
+    if edges is None:
+        logger.warning("Bridge augmentation blocked by existing edges.")
+        count("fallback.pipeline")
+        return []
+    logger.info("Made the graph 2-edge-connected with %s edges", len(edges))
+    return edges
@@ -0,0 +1,208 @@
+import networkx as nx
+from augmentation import augment_connectivity
+from complement import ComplementView
+from connectivity import compute_edge_connectivity, local_cut_below
+from exact_augmentation import exact_augmentation
+from matching import compute_maximum_matching
+from tracing import count, logger, timed
+
+
+class DynamicAugmenter:
+    """
+    Keeps an augmenting edge set current while the graph changes.
+
+    The answer A is maintained so that G + A stays `target`-edge-connected
+    (default k + 1), and every update only looks at the cuts it can affect:
+    - an insert never lowers connectivity, so it costs nothing (an edge of A that
+      becomes a graph edge just leaves A);
+    - deleting (u, v) only shrinks the cuts that separate u and v, by one, so one
+      u-v flow stopped after `target` paths decides whether G + A still holds.
+      When it does not, the short cuts are exactly the minimum u-v cuts, and a
+      single new edge from u's residual side to v's crosses all of them;
+    - a new vertex only needs its own degree raised to the target.
+    Only when no such edge is free does the exact k -> k+1 engine (or the full
+    pipeline) run on G + A.
+
+    The degree-k vertex set is kept current per update, and so is a matching of
+    its complement: an update only drops the pairs of the vertices it touched
+    that are no longer complement edges and rematches the freed vertices among
+    the unmatched ones (which a maximum matching leaves pairwise adjacent, so
+    there are few). A local repair tries the matched pairs first.
+    After inserts A can contain edges that are no longer needed; resolve()
+    recomputes A and the maximum matching from scratch.
+    """
+
+    def __init__(self, edges, k, target=None):
+        self.graph = nx.Graph()
+        self.graph.add_edges_from(edges)
+        self.k = k
+        self.target = k + 1 if target is None else target
+        self.repairs = 0
+        self.vertices_k = {u for u, d in self.graph.degree() if d == self.k}
+        self._mate = {}
+        self._free = set(self.vertices_k)
+        self.resolve()
+
+    @timed("dynamic.resolve")
+    def resolve(self):
+        """Recompute the augmenting edges from scratch with augment_connectivity."""
+        result = augment_connectivity(list(self.graph.edges()), self.k, target=self.target)
+        self._added = {frozenset(e): tuple(e) for e in result.new_edges}
+        self._augmented = self.graph.copy()
+        self._augmented.add_edges_from(self._added.values())
+        self._repair(compute_edge_connectivity(self._augmented))
+        view = ComplementView(self.graph, list(self.vertices_k))
+        self._mate = {}
+        for a, b in compute_maximum_matching(view, initial_matching=self.matching):
+            self._mate[a], self._mate[b] = b, a
+        self._free = self.vertices_k - self._mate.keys()
+        return self.augmenting_edges()
+
+    def _degree_changed(self, u):
+        if self.graph.has_node(u) and self.graph.degree(u) == self.k:
+            self.vertices_k.add(u)
+        else:
+            self.vertices_k.discard(u)
+        self._rematch(u)
+
+    def _rematch(self, u):
+        """
+        Update the matching around u after its degree or adjacency changed: drop
+        its pair if that is no longer a complement edge between degree-k
+        vertices, then match each freed vertex to an unmatched one it may join.
+        """
+        freed = [u]
+        x = self._mate.get(u)
+        if x is not None and (u not in self.vertices_k or x not in self.vertices_k or self.graph.has_edge(u, x)):
+            del self._mate[u], self._mate[x]
+            freed.append(x)
+        for a in freed:
+            self._free.discard(a)
+            if a not in self.vertices_k or a in self._mate:
+                continue
+            b = next((b for b in self._free if not self.graph.has_edge(a, b)), None)
+            if b is None:
+                self._free.add(a)
+            else:
+                self._free.discard(b)
+                self._mate[a], self._mate[b] = b, a
+                count("dynamic.rematches")
+
+    def insert_edge(self, u, v):
+        """Add (u, v) to the graph; an augmenting edge it duplicates is dropped from A."""
+        if self.graph.has_edge(u, v):
+            return
+        new = [w for w in (u, v) if not self._augmented.has_node(w)]
+        self.graph.add_edge(u, v)
+        for w in (u, v):
+            self._degree_changed(w)
+        if self._added.pop(frozenset((u, v)), None) is None:
+            self._augmented.add_edge(u, v)
+        count("dynamic.inserts")
+        # Only a joining vertex can leave G + A short: its own degree is the one cut
+        # below the target, unless the edge joins two new vertices
+        if len(new) == 1:
+            self._raise_degree(new[0])
+        elif new:
+            self._repair(compute_edge_connectivity(self._augmented))
+
+    def delete_edge(self, u, v):
+        """Remove (u, v) from the graph and repair A if G + A lost connectivity."""
+        self.graph.remove_edge(u, v)
+        self._augmented.remove_edge(u, v)
+        for w in (u, v):
+            self._degree_changed(w)
+        count("dynamic.deletes")
+        sides = local_cut_below(self._augmented, u, v, self.target)
+        if sides is not None and not self._join(*sides, last=(u, v)):
+            self._repair(self.target - 1)
+
+    def apply(self, updates):
+        """Apply a stream of ("insert" | "delete", u, v) updates; returns the current answer."""
+        for op, u, v in updates:
+            if op == "insert":
+                self.insert_edge(u, v)
+            elif op == "delete":
+                self.delete_edge(u, v)
+            else:
+                raise ValueError(f"unknown update {op!r}")
+        return self.augmenting_edges()
+
+    def _add(self, a, b):
+        self._added[frozenset((a, b))] = (a, b)
+        self._augmented.add_edge(a, b)
+
+    def _join(self, source_side, sink_side, last):
+        """
+        Add one free edge between the two sides: a pair of the degree-k matching
+        when one crosses them, otherwise the lowest degrees first. The deleted
+        edge `last` is only proposed again when it is the sole option.
+        Returns False when no pair is free.
+        """
+        degree = self._augmented.degree
+        avoid = frozenset(last)
+        for a, b in self.matching:
+            if a in sink_side:
+                a, b = b, a
+            if (a in source_side and b in sink_side and not self._augmented.has_edge(a, b)
+                    and frozenset((a, b)) != avoid):
+                self._add(a, b)
+                count("dynamic.matched_repairs")
+                return True
+        for a in sorted(source_side, key=degree):
+            for b in sorted(sink_side, key=degree):
+                if a != b and not self._augmented.has_edge(a, b) and frozenset((a, b)) != avoid:
+                    self._add(a, b)
+                    count("dynamic.local_repairs")
+                    return True
+        if last[0] in source_side and last[1] in sink_side:
+            self._add(*last)
+            count("dynamic.local_repairs")
+            return True
+        return False
+
+    def _raise_degree(self, w):
+        """Give a vertex that just joined G + A enough edges to reach the target degree."""
+        others = sorted((x for x in self._augmented.nodes() if x != w and not self._augmented.has_edge(w, x)),
+                        key=self._augmented.degree)
+        for x in others[:max(self.target - self._augmented.degree(w), 0)]:
+            self._add(w, x)
+        if self._augmented.degree(w) < self.target:
+            self._repair(compute_edge_connectivity(self._augmented))
+
+    def _repair(self, level):
+        """Raise G + A from connectivity `level` back to the target, one level at a time."""
+        while level < self.target:
+            self.repairs += 1
+            count("dynamic.repairs")
+            result = exact_augmentation(self._augmented, level, level)
+            if result is not None:
+                new_edges = result[1]
+                level += 1
+            else:
+                logger.info("Exact repair blocked; re-running the pipeline on G + A")
+                new_edges = augment_connectivity(list(self._augmented.edges()), level,
+                                                 target=self.target).new_edges
+                level = self.target
+            for a, b in new_edges:
+                self._add(a, b)
+
+    @property
+    def matching(self):
+        """
+        Matching among the degree-k vertices in the complement of G: maximum
+        after resolve(), kept maximal by the updates since.
+        """
+        pairs, seen = [], set()
+        for a, b in self._mate.items():
+            if a not in seen:
+                seen.add(b)
+                pairs.append((a, b))
+        return pairs
+
+    def augmenting_edges(self):
+        """The current answer: edges that raise G to the target."""
+        return list(self._added.values())
+
+    def augmented_graph(self):
+        return self._augmented.copy()
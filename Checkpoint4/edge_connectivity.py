@@ -1,6 +1,8 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 import time
+from complement import ComplementView
+from matching import compute_maximum_matching
 
 def generate_graph():
     """Generate a k-edge-connected simple graph."""
@@ -10,21 +12,12 @@ def generate_graph():
     return G
 
 def complement_graph(G):
-    """Compute the complement graph G'."""
-    nodes = set(G.nodes())
-    G_comp = nx.Graph()
-    G_comp.add_nodes_from(nodes)
-    
-    for u in nodes:
-        for v in nodes:
-            if u != v and not G.has_edge(u, v):
-                G_comp.add_edge(u, v)
-    
-    return G_comp
+    """Lazy view of the complement graph G'."""
+    return ComplementView(G)
 
 def find_maximum_matching(G_comp):
     """Find a maximum matching in the complement graph using Edmonds' algorithm."""
-    matching = nx.max_weight_matching(G_comp, maxcardinality=True)
+    matching = compute_maximum_matching(G_comp)
     return matching
 
 def augment_graph(G, matching):
@@ -50,10 +43,10 @@ def analyze_complexity():
         G = nx.erdos_renyi_graph(size, 0.5)  # Generate random graph
         G_comp = complement_graph(G)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         matching = find_maximum_matching(G_comp)
         G_augmented = augment_graph(G, matching)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         times.append(end_time - start_time)
     
@@ -65,25 +58,27 @@ def analyze_complexity():
     plt.grid(True)
     plt.show()
 
-# Generate graph and its complement
-G = generate_graph()
-G_comp = complement_graph(G)
-matching = find_maximum_matching(G_comp)
+if __name__ == "__main__":
+    # Demo only; benchmark.py is the reproducible benchmark suite
+    # Generate graph and its complement
+    G = generate_graph()
+    G_comp = complement_graph(G)
+    matching = find_maximum_matching(G_comp)
 
-# Visualize before augmentation
-visualize_graph(G, "Original Graph")
+    # Visualize before augmentation
+    visualize_graph(G, "Original Graph")
 
-# Augment graph
-G_augmented = augment_graph(G, matching)
+    # Augment graph
+    G_augmented = augment_graph(G, matching)
 
-# Visualize after augmentation
-visualize_graph(G_augmented, "Augmented Graph")
+    # Visualize after augmentation
+    visualize_graph(G_augmented, "Augmented Graph")
 
-# Print results
-print("Original Graph Edges:", G.edges())
-print("Complement Graph Edges:", G_comp.edges())
-print("Maximum Matching in Complement Graph:", matching)
-print("Augmented Graph Edges:", G_augmented.edges())
+    # Print results
+    print("Original Graph Edges:", G.edges())
+    print("Complement Graph Edges:", list(G_comp.edges()))
+    print("Maximum Matching in Complement Graph:", matching)
+    print("Augmented Graph Edges:", G_augmented.edges())
 
-# Run complexity analysis
-analyze_complexity()
+    # Run complexity analysis
+    analyze_complexity()
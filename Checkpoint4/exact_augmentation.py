@@ -0,0 +1,254 @@
+from connectivity import compute_edge_connectivity, edge_connectivity_at_least, local_cut_below, weighted_degree
+from min_cuts import _unit_capacity_copy
+from tracing import checkpoint, count, logger, timed
+
+SOURCE = ("__augmentation__", "source")
+SINK = ("__augmentation__", "sink")
+
+
+def _min_cut_side(G, s, t, lam):
+    """
+    Minimal s-side of a minimum s-t cut when its value is lam, otherwise None.
+    The flow stops after lam + 1 augmenting paths, so non-tight pairs are cheap.
+    """
+    checkpoint()
+    count("max_flow_calls")
+    sides = local_cut_below(G, s, t, lam + 1)
+    return None if sides is None else sides[0]
+
+
+def minimal_tight_sets(G, lam):
+    """
+    The minimal vertex sets X with d(X) = lam (the deficient extreme sets for
+    target lam + 1). They are pairwise disjoint.
+
+    With a root r, the minimal tight set containing any v != r is the minimal
+    v-side of a minimum v-r cut, so one flow per vertex finds every minimal tight
+    set avoiding r; one more flow towards a vertex of a set already found recovers
+    the set containing r. Vertices of degree lam are singleton sets and need no
+    flow, so at most n flows are run. Weighted (contracted) graphs are supported.
+    """
+    nodes = list(G.nodes())
+    if len(nodes) < 2:
+        return []
+    degree = dict(weighted_degree(G))
+    root = nodes[0]
+    candidates = []
+    for v in nodes[1:]:
+        if degree[v] == lam:
+            candidates.append({v})
+            continue
+        side = _min_cut_side(G, v, root, lam)
+        if side is not None:
+            candidates.append(side)
+
+    tight = []
+    covered = set()
+    for side in sorted(candidates, key=len):
+        if not side & covered:
+            tight.append(side)
+            covered |= side
+
+    if tight and root not in covered:
+        if degree[root] == lam:
+            tight.append({root})
+        else:
+            side = _min_cut_side(G, root, next(iter(tight[0])), lam)
+            if side is not None and not side & covered:
+                tight.append(side)
+    return tight
+
+
+def _separates_well(H, X, Y, lam):
+    """
+    True when every set containing X and Y but no other remaining tight set has
+    d > lam, i.e. joining X and Y removes both from the tight family without
+    creating a new minimal tight set. The other remaining sets are the ones
+    still attached to SINK in H.
+    """
+    # lam + 1 units already stand for "unbounded" when the flow stops at lam + 1
+    for u in X | Y:
+        H.add_edge(SOURCE, u, capacity=lam + 1)
+    checkpoint()
+    count("max_flow_calls")
+    try:
+        return local_cut_below(H, SOURCE, SINK, lam + 1, capacity="capacity") is None
+    finally:
+        H.remove_node(SOURCE)
+
+
+def _attach(H, X, lam):
+    for u in X:
+        H.add_edge(u, SINK, capacity=lam + 1)
+
+
+def _detach(H, X):
+    for u in X:
+        H.remove_edge(u, SINK)
+
+
+def _preorder(H):
+    """{vertex: position} in a depth-first preorder of H, one tree per component."""
+    position = {}
+    for start in H.nodes():
+        if start in position:
+            continue
+        stack = [start]
+        while stack:
+            u = stack.pop()
+            if u in position:
+                continue
+            position[u] = len(position)
+            stack.extend(v for v in H.neighbors(u) if v not in position)
+    return position
+
+
+def _opposite_first(size):
+    """Indices 1..size-1, starting half-way round and moving outwards."""
+    middle = size // 2
+    for step in range(size):
+        for j in (middle + step, middle - step - 1):
+            if 1 <= j < size and (step or j == middle):
+                yield j
+
+
+def augment_by_one(G, lam=None, room=None):
+    """
+    Deterministically raise the edge-connectivity of a simple graph from lam to lam + 1.
+
+    The minimal tight sets X_1..X_t are computed once (at most n flows), and
+    ceil(t/2) is a lower bound on the number of new edges. The sets are kept in
+    depth-first order, all attached to a flow sink. While four or more remain,
+    the first set is joined to a partner whose joint side cannot be isolated by
+    a cut of value lam: candidates are tried from the set half-way round the
+    order outwards (with four left, those leaving a pair that one edge can still
+    join come first), one capped flow each, stopping at the first that passes.
+    Such a pair always exists, and joining it leaves exactly the other sets as
+    the minimal tight family, so both are simply detached from the sink. The last two or
+    three sets are then closed with one or two edges (two sets with no free
+    pair between them get one edge each to a shared outside vertex). Each edge
+    uses a vertex pair that is not adjacent yet.
+
+    `room(x, y)` is how many x-y edges the final graph may have: 1 on a simple
+    graph (the default), more between the super-vertices of a contracted one.
+
+    Returns the list of new edges, or None when the simple-graph restriction
+    blocks every admissible pair (e.g. all deficient vertices already adjacent).
+    """
+    if lam is None:
+        lam = compute_edge_connectivity(G)
+    H = _unit_capacity_copy(G)
+    position = _preorder(H)
+    remaining = sorted((set(X) for X in minimal_tight_sets(G, lam)), key=lambda X: min(position[u] for u in X))
+    logger.debug("Found %s minimal tight sets, lower bound %s edges", len(remaining), (len(remaining) + 1) // 2)
+    added = []
+
+    room = (lambda x, y: 1) if room is None else room
+
+    def free_pair(X, Y):
+        for x in sorted(X, key=G.degree):
+            for y in sorted(Y, key=G.degree):
+                if x != y and (H[x][y]["capacity"] if H.has_edge(x, y) else 0) < room(x, y):
+                    return x, y
+        return None
+
+    def join(pair):
+        _bump(H, *pair, 1)
+        added.append(pair)
+
+    if len(remaining) >= 4:
+        for X in remaining:
+            _attach(H, X, lam)
+    while len(remaining) >= 4:
+        X = remaining[0]
+        _detach(H, X)
+        order = list(_opposite_first(len(remaining)))
+        if len(remaining) == 4:
+            # Prefer leaving two sets that one edge can still join
+            order.sort(key=lambda j: free_pair(*(remaining[i] for i in range(1, 4) if i != j)) is None)
+        chosen = None
+        for j in order:
+            count("candidate_edges")
+            pair = free_pair(X, remaining[j])
+            if pair is None:
+                continue
+            _detach(H, remaining[j])
+            if _separates_well(H, X, remaining[j], lam):
+                chosen = j, pair
+                break
+            _attach(H, remaining[j], lam)
+        if chosen is None:
+            return None
+        j, pair = chosen
+        join(pair)
+        del remaining[j]
+        del remaining[0]
+    if SINK in H:
+        H.remove_node(SINK)
+
+    if len(remaining) == 2:
+        X, Y = remaining
+        pair = free_pair(X, Y)
+        if pair is not None:
+            join(pair)
+        else:
+            # Two edges to one outside vertex w: a tight set holds exactly one of
+            # X and Y, so exactly one of the edges crosses it whichever side w is on
+            for w in sorted((w for w in G if w not in X and w not in Y), key=G.degree):
+                first, second = free_pair(X, {w}), free_pair(Y, {w})
+                if first is not None and second is not None:
+                    join(first)
+                    join(second)
+                    break
+            else:
+                return None
+    elif len(remaining) == 3:
+        # Any two edges that touch all three sets and share one set cover every tight set
+        for a, b, c in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+            first = free_pair(remaining[a], remaining[b])
+            if first is None:
+                continue
+            _bump(H, *first, 1)
+            second = free_pair(remaining[c], remaining[a])
+            _bump(H, *first, -1)
+            if second is not None:
+                join(first)
+                join(second)
+                break
+        else:
+            return None
+    return added
+
+
+def _bump(H, x, y, delta):
+    """Change the x-y capacity of the flow network H by delta, dropping the edge at 0."""
+    capacity = (H[x][y]["capacity"] if H.has_edge(x, y) else 0) + delta
+    if capacity:
+        H.add_edge(x, y, capacity=capacity)
+    else:
+        H.remove_edge(x, y)
+
+
+@timed("exact")
+def exact_augmentation(G, k, lam=None):
+    """
+    Exact k -> k+1 step used in place of the trial-and-error fallbacks; the
+    result is checked to be (k+1)-edge-connected before it is returned.
+    Returns (G_aug, new_edges), or None when lambda(G) != k or the engine is blocked.
+    """
+    if lam is None:
+        lam = compute_edge_connectivity(G)
+    if lam != k or G.number_of_nodes() < 2:
+        return None
+    new_edges = augment_by_one(G, lam)
+    if new_edges is None:
+        logger.warning("Exact augmentation blocked by existing edges.")
+        return None
+    G_aug = G.copy()
+    G_aug.add_edges_from(new_edges)
+    if not edge_connectivity_at_least(G_aug, k + 1):
+        logger.warning("Exact augmentation result failed verification; discarding it.")
+        count("exact.rejected")
+        return None
+    logger.info("Exact augmentation added %s edges.", len(new_edges))
+    return G_aug, new_edges
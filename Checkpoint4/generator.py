@@ -0,0 +1,85 @@
+import numpy as np
+from compact_graph import CompactGraph
+
+
+def _ring(positions, size, offset):
+    """Edges i -- i + offset (mod size) for every i in positions."""
+    return positions, (positions + offset) % size
+
+
+def harary_edges(n, k):
+    """
+    Endpoint arrays of the Harary graph H(k, n): the ring with offsets
+    1..k//2, plus "diameters" when k is odd. It is k-edge-connected with
+    ceil(kn/2) edges, every vertex has degree k except vertex 0 when k and n
+    are both odd.
+    """
+    i = np.arange(n, dtype=np.int64)
+    parts = [_ring(i, n, s) for s in range(1, k // 2 + 1)]
+    if k % 2:
+        half = np.arange((n + 1) // 2, dtype=np.int64)
+        parts.append((half, (half + (n + 1) // 2) % n))
+    return parts
+
+
+def min_free_vertices(k):
+    """Vertices that must stay above degree k for generate_edges to work."""
+    return 3 if k == 1 else 2 * (k // 2 + 1)
+
+
+def generate_edges(n, k, degree_k=None, avg_degree=None, seed=None):
+    """
+    Endpoint arrays (src, dst) of a connected graph with edge connectivity
+    exactly k, exactly `degree_k` vertices of degree k (default n // 10, at least
+    one) and about `avg_degree` mean degree (default just the backbone).
+
+    Built in O(n + m) NumPy operations without rejection sampling:
+    - the `degree_k` vertices and the others ("free") share a Harary graph H(k, n),
+      which gives lambda >= k, while the untouched degree-k vertices give lambda <= k;
+    - every free vertex gets one more edge (offset k//2 + 1 on the ring, which the
+      backbone never uses), so it ends above degree k;
+    - the remaining density is uniform random edges between free vertices;
+    - the vertices are finally relabelled by a random permutation.
+    For k = 1 the free vertices form a cycle and the degree-1 vertices hang off it.
+    Duplicate random edges are dropped, so the edge count can fall slightly short.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    rng = np.random.default_rng(seed)
+    fixed = min_free_vertices(k)
+    d = max(1, n // 10) if degree_k is None else degree_k
+    d = min(d, n - fixed) if degree_k is None else d
+    free = n - d
+    if d < 1 or free < fixed:
+        raise ValueError(f"need 1 <= degree_k <= n - {fixed} for k = {k}")
+    if k > 1 and n < 2 * (k // 2 + 1) + 3:
+        raise ValueError(f"n must be at least {2 * (k // 2 + 1) + 3} for k = {k}")
+
+    if k == 1:
+        core = np.arange(free, dtype=np.int64)
+        leaves = np.arange(free, n, dtype=np.int64)
+        parts = [_ring(core, free, 1), (leaves, rng.integers(free, size=d))]
+    else:
+        # Free vertices are positions 0..free-1 (so vertex 0, the one that may have
+        # degree k + 1, is free); cover each of them with an offset-t edge inside that arc
+        t = k // 2 + 1
+        parts = harary_edges(n, k)
+        left = np.arange(free - t, dtype=np.int64)
+        parts.append((left, left + t))
+
+    m = sum(len(src) for src, _ in parts)
+    if avg_degree is not None:
+        extra = max(int(avg_degree * n / 2) - m, 0)
+        u, v = rng.integers(free, size=extra), rng.integers(free, size=extra)
+        parts.append((u[u != v], v[u != v]))
+
+    perm = rng.permutation(n)
+    src = perm[np.concatenate([a for a, _ in parts])]
+    dst = perm[np.concatenate([b for _, b in parts])]
+    return src, dst
+
+
+def generate_graph(n, k, degree_k=None, avg_degree=None, seed=None):
+    """CompactGraph on vertices 0..n-1 from generate_edges (duplicates removed)."""
+    src, dst = generate_edges(n, k, degree_k, avg_degree, seed)
+    return CompactGraph.from_index_arrays(range(n), src, dst, bitset=False)
@@ -0,0 +1,176 @@
+import json
+import os
+import warnings
+
+import numpy as np
+from compact_graph import CompactGraph
+
+CHUNK_BYTES = 1 << 24
+COMMENT_PREFIXES = (b"#", b"%")
+CSR_FILES = ("indptr.npy", "indices.npy")
+
+
+def _parse_block(block):
+    """
+    Endpoint array of shape (lines, 2) for a block of whole lines.
+    Comment lines are dropped and extra columns (weights, timestamps) ignored.
+    Integer ids come back as int64, anything else as a bytes array.
+    """
+    if any(prefix in block for prefix in COMMENT_PREFIXES):
+        block = b"\n".join(line for line in block.splitlines()
+                           if line.strip() and line.lstrip()[:1] not in COMMENT_PREFIXES)
+    first = next((line for line in block.split(b"\n", 64) if line.strip()), None)
+    if first is None:
+        return np.empty((0, 2), dtype=np.int64)
+    columns = len(first.split())
+    try:
+        # C-level integer parser; a token it cannot read raises instead of truncating
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            tokens = np.fromstring(block, dtype=np.int64, sep=" ")
+    except (DeprecationWarning, ValueError):
+        tokens = np.array(block.split())
+    if columns < 2 or len(tokens) % columns:
+        raise ValueError("edge list lines must all have the same number of columns (at least two)")
+    pairs = tokens.reshape(-1, columns)[:, :2]
+    if pairs.dtype.kind == "S":
+        # Non-integer extra columns (e.g. float weights) with integer endpoints
+        try:
+            return pairs.astype(np.int64)
+        except ValueError:
+            pass
+    return pairs
+
+
+def iter_edge_chunks(path, chunk_bytes=CHUNK_BYTES):
+    """Stream a whitespace-separated "u v" edge list as endpoint arrays of whole lines."""
+    with open(path, "rb") as f:
+        tail = b""
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                break
+            block = tail + block
+            cut = block.rfind(b"\n")
+            if cut < 0:
+                tail = block
+                continue
+            tail = block[cut + 1:]
+            yield _parse_block(block[:cut + 1])
+        if tail.strip():
+            yield _parse_block(tail)
+
+
+def load_edge_list(path, chunk_bytes=CHUNK_BYTES):
+    """
+    Read a text edge list into a CompactGraph without building Python tuples.
+
+    The file is parsed in chunks with NumPy and the vertex ids are renumbered to
+    0..n-1 by one stable argsort of all endpoints (first occurrences in sorted
+    order get consecutive numbers). Graphs whose ids already are 0..n-1 keep them as
+    labels; other ids (sparse integers or strings) become the vertex labels.
+    """
+    chunks = [chunk for chunk in iter_edge_chunks(path, chunk_bytes) if len(chunk)]
+    if not chunks:
+        return CompactGraph.from_index_arrays(range(0), np.empty(0, np.int64), np.empty(0, np.int64))
+    if any(chunk.dtype.kind == "S" for chunk in chunks):
+        chunks = [chunk.astype(bytes) for chunk in chunks]
+    pairs = np.concatenate(chunks).ravel()
+    del chunks
+    # Sort-based renumbering (np.unique's inverse is several times slower here)
+    order = np.argsort(pairs, kind="stable")
+    ordered = pairs[order]
+    first = np.concatenate(([True], ordered[1:] != ordered[:-1]))
+    ids = ordered[first]
+    inverse = np.empty(len(pairs), dtype=np.int64)
+    inverse[order] = np.cumsum(first) - 1
+    inverse = inverse.reshape(-1, 2)
+    if ids.dtype.kind == "S":
+        labels = [label.decode() for label in ids.tolist()]
+    elif len(ids) and ids[0] == 0 and ids[-1] == len(ids) - 1:
+        labels = range(len(ids))
+    else:
+        labels = ids.tolist()
+    return CompactGraph.from_index_arrays(labels, inverse[:, 0], inverse[:, 1], bitset=False)
+
+
+def save_csr(G, path):
+    """
+    Write G (a CompactGraph or networkx graph) as a directory of .npy arrays:
+    indptr, indices (int32 when the vertex count allows it) and, unless the
+    vertices are 0..n-1, labels. load_csr memory-maps them back.
+    """
+    if not isinstance(G, CompactGraph):
+        G = CompactGraph.from_networkx(G, bitset=False)
+    labels, indptr, indices = G.csr()
+    os.makedirs(path, exist_ok=True)
+    dtype = np.int32 if len(labels) < 2 ** 31 and len(indices) < 2 ** 31 else np.int64
+    _save_array(os.path.join(path, "indptr.npy"), np.asarray(indptr, dtype=dtype))
+    _save_array(os.path.join(path, "indices.npy"), np.asarray(indices, dtype=dtype))
+    label_path = os.path.join(path, "labels.npy")
+    if isinstance(labels, range):
+        if os.path.exists(label_path):
+            os.remove(label_path)
+    else:
+        _save_array(label_path, np.array(labels))
+
+
+def _save_array(path, array):
+    """np.save through a temporary file and a rename, so graphs still mapping the old file keep it."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def load_csr(path, mmap=True):
+    """Open a graph written by save_csr; with mmap the arrays are paged in on demand."""
+    mode = "r" if mmap else None
+    indptr = np.load(os.path.join(path, "indptr.npy"), mmap_mode=mode)
+    indices = np.load(os.path.join(path, "indices.npy"), mmap_mode=mode)
+    label_path = os.path.join(path, "labels.npy")
+    labels = np.load(label_path).tolist() if os.path.exists(label_path) else range(len(indptr) - 1)
+    return CompactGraph(labels, indptr, indices)
+
+
+def is_csr(path):
+    return os.path.isdir(path) and all(os.path.exists(os.path.join(path, f)) for f in CSR_FILES)
+
+
+def _source_stamp(path):
+    info = os.stat(path)
+    return {"size": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+
+def load_graph(path, cache=False):
+    """
+    Load a CSR directory or a text edge list. With `cache` (off by default), a
+    parsed edge list is also saved next to it as "<path>.csr", stamped with the
+    text file's size and modification time; later runs memory-map the cache
+    only while both still match. A cache that cannot be written (e.g. a
+    read-only directory) only triggers a warning.
+    """
+    if is_csr(path):
+        return load_csr(path)
+    cached = path + ".csr"
+    stamp_path = os.path.join(cached, "source.json")
+    if cache and is_csr(cached) and os.path.exists(stamp_path):
+        with open(stamp_path) as f:
+            if json.load(f) == _source_stamp(path):
+                return load_csr(cached)
+    G = load_edge_list(path)
+    if cache:
+        try:
+            save_csr(G, cached)
+            with open(stamp_path, "w") as f:
+                json.dump(_source_stamp(path), f)
+        except OSError as error:
+            warnings.warn(f"could not cache {path} as {cached}: {error}")
+    return G
+
+
+def save_edge_list(edges, path):
+    """Write (u, v) pairs, e.g. the new edges of an augmentation, as a text edge list."""
+    with open(path, "w") as f:
+        for u, v in edges:
+            f.write(f"{u} {v}\n")
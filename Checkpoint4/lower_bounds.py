@@ -0,0 +1,83 @@
+import math
+
+from compact_graph import as_networkx
+from complement import ComplementView
+from connectivity import compute_edge_connectivity
+from contraction import contract_components
+from exact_augmentation import minimal_tight_sets
+from matching import compute_maximum_matching
+from tracing import count, timed
+
+# Flows extreme_set_bound may run before giving up on the tighter bound
+MAX_BOUND_FLOWS = 1000
+
+
+def deficiencies(G, target):
+    """{vertex: target - degree} for every vertex of degree below `target`."""
+    return {u: target - d for u, d in G.degree() if d < target}
+
+
+def degree_bound(G, target, matching=None):
+    """
+    Edges needed just to lift every vertex to degree `target`, corrected for
+    simple graphs: a new edge serves two deficient vertices only if they are not
+    adjacent yet. With deficient set D and M the most edges that can join two of
+    them, at least sum(deficiency) - M edges are needed. When every deficiency
+    is 1, M is a maximum matching in the complement of G[D] (pass it as
+    `matching` when it is known); otherwise M is capped by the free pairs around
+    each vertex.
+    """
+    deficit = deficiencies(G, target)
+    total = sum(deficit.values())
+    if not deficit:
+        return 0
+    if max(deficit.values()) == 1:
+        if matching is None:
+            matching = compute_maximum_matching(ComplementView(G, list(deficit)))
+        return total - len(matching)
+    inside = {u: sum(1 for v in G.neighbors(u) if v in deficit) for u in deficit}
+    free = sum(min(d, len(deficit) - 1 - inside[u]) for u, d in deficit.items())
+    return total - min(free // 2, total // 2)
+
+
+def extreme_set_bound(G, target, lam=None, max_flows=MAX_BOUND_FLOWS):
+    """
+    ceil(sum deficiency / 2) over the minimal tight sets of G (the sets X with
+    d(X) = lambda, each short of `target` by target - lambda) and the deficient
+    vertices outside them. They are pairwise disjoint and every new edge enters
+    at most two, so this is a lower bound; for target = lambda + 1 it is the
+    optimum up to the simple-graph restriction.
+
+    The tight sets are found on G with its (lambda+1)-edge-connected parts
+    contracted, one flow per super-vertex of degree above lambda. Returns None
+    when that would take more than `max_flows` flows.
+    """
+    G = as_networkx(G)
+    lam = compute_edge_connectivity(G) if lam is None else lam
+    if lam >= target or G.number_of_nodes() < 2:
+        return 0
+    H, members = contract_components(G, lam)
+    if sum(1 for _, d in H.degree(weight="weight") if d > lam) > max_flows:
+        count("lower_bound.skipped")
+        return None
+    tight = [set(u for c in X for u in members[c]) for X in minimal_tight_sets(H, lam)]
+    deficit = deficiencies(G, target)
+    covered = set().union(*tight)
+    total = sum(max(target - lam, sum(deficit.get(u, 0) for u in X)) for X in tight)
+    total += sum(d for u, d in deficit.items() if u not in covered)
+    return math.ceil(total / 2)
+
+
+@timed("lower_bound")
+def lower_bound(G, target, lam=None, matching=None, at_most=None):
+    """
+    Proven minimum number of new edges that make G `target`-edge-connected: the
+    larger of degree_bound and extreme_set_bound. The flows are skipped when the
+    degree bound already reaches `at_most` (e.g. the size of an answer in hand,
+    which is then optimal).
+    """
+    bound = degree_bound(G, target, matching)
+    if at_most is not None and bound >= at_most:
+        count("lower_bound.early_exits")
+        return bound
+    return max(bound, extreme_set_bound(G, target, lam) or 0)
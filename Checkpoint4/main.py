@@ -49,11 +49,12 @@
 
 # if __name__ == "__main__":
 #     main()
-from graph_utils import generate_random_graph, get_complement_graph, get_vertices_of_degree_k, get_subgraph_by_vertices, generate_graph_from_edges
-from augmentation import augment_connectivity, compute_edge_connectivity
-# from connectivity import compute_edge_connectivity
-from visualize import draw_graph
+from graph_utils import generate_random_graph, get_vertices_of_degree_k, get_subgraph_by_vertices, generate_graph_from_edges
+from augmentation import augment_connectivity
+from connectivity import compute_edge_connectivity
+from visualize import Renderer
 import networkx as nx
+import logging
 import random
 from itertools import combinations
 import unittest
@@ -102,20 +103,23 @@ def main():
     # else:
     #     raise ValueError("Invalid MODE. Use 'random' or 'testcase'.")
 
-    draw_graph(G, title="Original Graph", filename="original_graph.png")
-    print(f"Original edge connectivity: {compute_edge_connectivity(G)}")
+    # Pictures render in a background process on one shared layout; the
+    # augmented graph is the original plus the new edges as an overlay
+    with Renderer() as renderer:
+        renderer.draw(G, "Original Graph", "original_graph.png")
+        print(f"Original edge connectivity: {compute_edge_connectivity(G)}")
 
-    G_comp = get_complement_graph(G)
-    draw_graph(G_comp, title="Complement Graph", filename="complement_graph.png")
+        renderer.draw_complement(G, "Complement Graph", "complement_graph.png")
 
-    # Augment using internal logic
-    edges = list(G.edges())
-    G_aug, new_edges = augment_connectivity(edges, CONNECTIVITY_LEVEL)
+        # Augment using internal logic
+        edges = list(G.edges())
+        G_aug, new_edges = augment_connectivity(edges, CONNECTIVITY_LEVEL)
 
-    draw_graph(G_aug, title="Augmented Graph", highlight_edges=new_edges, filename="augmented_graph.png")
-    print(f"New edge connectivity: {compute_edge_connectivity(G_aug)}")
-    print(f"Edges added: {new_edges}")
+        renderer.draw(G, "Augmented Graph", "augmented_graph.png", overlay=new_edges)
+        print(f"New edge connectivity: {compute_edge_connectivity(G_aug)}")
+        print(f"Edges added: {new_edges}")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     main()
@@ -1,8 +1,152 @@
-import networkx as nx
+from collections import deque
 
-def compute_maximum_matching(G):
-    matching = nx.max_weight_matching(G, maxcardinality=True)
-    return list(matching)
+from tracing import checkpoint
+
+
+def karp_sipser_matching(G, initial_matching=None):
+    """
+    Maximal matching by the Karp-Sipser rule: a vertex with a single free neighbour
+    is always matched to it, otherwise the lowest-degree free vertex is matched.
+    Pairs of `initial_matching` that are still edges of G are kept first.
+    Returns a dict mapping every matched vertex to its mate.
+    """
+    mate = {}
+    for u, v in initial_matching or ():
+        if u != v and u not in mate and v not in mate and G.has_edge(u, v):
+            mate[u] = v
+            mate[v] = u
+
+    degree = {}
+    for u in G.nodes():
+        if u not in mate:
+            # On implicit (complement) graphs this scan is the expensive part
+            checkpoint()
+            degree[u] = sum(1 for v in G.neighbors(u) if v not in mate)
+    ones = [u for u, d in degree.items() if d == 1]
+    by_degree = sorted((u for u, d in degree.items() if d > 1), key=degree.get)
+
+    def take(u, v):
+        mate[u] = v
+        mate[v] = u
+        for w in (u, v):
+            for x in G.neighbors(w):
+                if x not in mate:
+                    degree[x] -= 1
+                    if degree[x] == 1:
+                        ones.append(x)
+
+    position = 0
+    while True:
+        checkpoint()
+        if ones:
+            u = ones.pop()
+        else:
+            while position < len(by_degree) and (by_degree[position] in mate or degree[by_degree[position]] == 0):
+                position += 1
+            if position == len(by_degree):
+                break
+            u = by_degree[position]
+        if u in mate:
+            continue
+        v = next((x for x in G.neighbors(u) if x not in mate), None)
+        if v is not None:
+            take(u, v)
+    return mate
+
+
+def _edmonds_matching(G, initial_matching=None):
+    """
+    Maximum-cardinality matching with Edmonds' blossom algorithm.
+    Only needs G.nodes(), G.neighbors(u) and G.has_edge(u, v), so it runs on implicit
+    graphs too. A Karp-Sipser warm start (seeded with `initial_matching`) leaves only a
+    few free vertices to grow augmenting paths from.
+    """
+    nodes = list(G.nodes())
+    index = {u: i for i, u in enumerate(nodes)}
+    n = len(nodes)
+    match = [-1] * n
+    for u, v in karp_sipser_matching(G, initial_matching).items():
+        match[index[u]] = index[v]
+
+    def neighbours(i):
+        # Recomputed on demand so implicit graphs never materialise their edges
+        return (index[v] for v in G.neighbors(nodes[i]))
+
+    def find_augmenting_path(root):
+        used = [False] * n
+        parent = [-1] * n
+        base = list(range(n))
+        used[root] = True
+        queue = deque([root])
+
+        def lowest_common_base(a, b):
+            seen = [False] * n
+            while True:
+                a = base[a]
+                seen[a] = True
+                if match[a] == -1:
+                    break
+                a = parent[match[a]]
+            while True:
+                b = base[b]
+                if seen[b]:
+                    return b
+                b = parent[match[b]]
+
+        def mark_path(v, b, child, blossom):
+            while base[v] != b:
+                blossom[base[v]] = blossom[base[match[v]]] = True
+                parent[v] = child
+                child = match[v]
+                v = parent[match[v]]
+
+        while queue:
+            v = queue.popleft()
+            for to in neighbours(v):
+                if base[v] == base[to] or match[v] == to:
+                    continue
+                if to == root or (match[to] != -1 and parent[match[to]] != -1):
+                    # Odd cycle: contract the blossom onto its base
+                    current_base = lowest_common_base(v, to)
+                    blossom = [False] * n
+                    mark_path(v, current_base, to, blossom)
+                    mark_path(to, current_base, v, blossom)
+                    for i in range(n):
+                        if blossom[base[i]]:
+                            base[i] = current_base
+                            if not used[i]:
+                                used[i] = True
+                                queue.append(i)
+                elif parent[to] == -1:
+                    parent[to] = v
+                    if match[to] == -1:
+                        return to, parent
+                    used[match[to]] = True
+                    queue.append(match[to])
+        return -1, parent
+
+    for root in range(n):
+        if match[root] != -1:
+            continue
+        checkpoint()
+        v, parent = find_augmenting_path(root)
+        while v != -1:
+            pv = parent[v]
+            ppv = match[pv]
+            match[v] = pv
+            match[pv] = v
+            v = ppv
+
+    return [(nodes[i], nodes[j]) for i, j in enumerate(match) if j != -1 and i < j]
+
+
+def compute_maximum_matching(G, initial_matching=None):
+    """
+    Maximum-cardinality matching of G as a list of edges.
+    Pass the previous matching as `initial_matching` when G changed only slightly;
+    its surviving pairs seed the search.
+    """
+    return _edmonds_matching(G, initial_matching)
 
 def get_unmatched_vertices(G, matching):
     matched = set(u for edge in matching for u in edge)
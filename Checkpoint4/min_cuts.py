@@ -0,0 +1,210 @@
+import networkx as nx
+from compact_graph import CompactGraph
+from connectivity import edge_connectivity_at_least
+from graph_utils import add_parallel_edge
+from tracing import count
+
+
+def _unit_capacity_copy(G):
+    """
+    Copy of G where every edge has capacity 1 (networkx treats a missing capacity as infinite).
+    On weighted (contracted) graphs the 'weight' multiplicity becomes the capacity.
+    """
+    H = nx.Graph()
+    H.add_nodes_from(G.nodes())
+    if isinstance(G, CompactGraph):
+        H.add_edges_from(G.edge_pairs(), capacity=1)
+    elif getattr(G, "graph", {}).get("weighted"):
+        H.add_edges_from((u, v, {"capacity": w}) for u, v, w in G.edges(data="weight", default=1))
+    else:
+        H.add_edges_from(G.edges(), capacity=1)
+    return H
+
+
+def build_cut_tree(G):
+    """
+    Build a Gomory-Hu tree of G using n-1 max-flow computations.
+    Every tree edge (a, b) carries the value of a minimum a-b cut in its 'weight'.
+    """
+    count("max_flow_calls", max(G.number_of_nodes() - 1, 0))
+    return nx.gomory_hu_tree(_unit_capacity_copy(G))
+
+
+def root_cut_tree(T):
+    """
+    Root the cut tree at an arbitrary node.
+    Returns (parent, depth) dictionaries; the root has parent None.
+    """
+    root = next(iter(T.nodes()))
+    parent = {root: None}
+    depth = {root: 0}
+    stack = [root]
+    while stack:
+        u = stack.pop()
+        for v in T.neighbors(u):
+            if v not in parent:
+                parent[v] = u
+                depth[v] = depth[u] + 1
+                stack.append(v)
+    return parent, depth
+
+
+def tree_path_nodes(parent, depth, u, v):
+    """
+    Yield the child endpoint of every tree edge on the u-v path.
+    A tree edge is identified by its lower endpoint (the node whose parent it leads to).
+    """
+    while depth[u] > depth[v]:
+        yield u
+        u = parent[u]
+    while depth[v] > depth[u]:
+        yield v
+        v = parent[v]
+    while u != v:
+        yield u
+        yield v
+        u = parent[u]
+        v = parent[v]
+
+
+class MinCutStructure:
+    """
+    Global minimum cuts of G read off its Gomory-Hu tree.
+
+    Every tree edge of minimum weight is a global minimum cut, and any two vertices
+    separated by some global minimum cut are separated by one of these, so together
+    they separate every pair that a bottleneck separates, after n-1 flow
+    computations. They need not be every minimum cut, so their crossing edges are
+    a subset of the edges on minimum cuts.
+    """
+
+    def __init__(self, G, tree=None):
+        self.graph = G
+        if G.number_of_nodes() < 2:
+            self.tree = nx.Graph()
+            self.tree.add_nodes_from(G.nodes())
+            self.parent, self.depth = {v: None for v in G.nodes()}, {v: 0 for v in G.nodes()}
+            self.connectivity = 0
+            return
+        self.tree = build_cut_tree(G) if tree is None else tree
+        self.parent, self.depth = root_cut_tree(self.tree)
+        self.connectivity = min(
+            (self.tree[v][p]["weight"] for v, p in self.parent.items() if p is not None),
+            default=0,
+        )
+
+    def _subtrees(self):
+        """Map every non-root tree node to the set of nodes in its subtree."""
+        order = sorted(self.parent, key=self.depth.get, reverse=True)
+        below = {v: {v} for v in order}
+        for v in order:
+            p = self.parent[v]
+            if p is not None:
+                below[p] |= below[v]
+        return below
+
+    def crossing_edges(self, side):
+        """Edges of the graph with exactly one endpoint in `side`."""
+        if len(side) * 2 > self.graph.number_of_nodes():
+            side = set(self.graph.nodes()) - side
+        return [(u, v) for u in side for v in self.graph.neighbors(u) if v not in side]
+
+    def sides(self):
+        """One shore of every minimum-weight tree cut, without listing the crossing edges."""
+        if self.graph.number_of_nodes() < 2:
+            return
+        below = self._subtrees()
+        for v, p in self.parent.items():
+            if p is not None and self.tree[v][p]["weight"] == self.connectivity:
+                yield below[v]
+
+    def cuts(self):
+        """
+        Enumerate the minimum-weight tree cuts as (side, crossing_edges) pairs.
+        `side` is one shore of the cut; the other shore is its complement.
+        These are global minimum cuts, but not all of them (a cycle has n(n-1)/2
+        and its tree only n-1).
+        """
+        for side in self.sides():
+            yield side, self.crossing_edges(side)
+
+    def bottleneck_edges(self):
+        """Edges crossing a minimum-weight tree cut."""
+        seen = set()
+        edges = []
+        for _, crossing in self.cuts():
+            for u, v in crossing:
+                if frozenset((u, v)) not in seen:
+                    seen.add(frozenset((u, v)))
+                    edges.append((u, v))
+        return edges
+
+
+class ConnectivityOracle:
+    """
+    Incremental answer to "has the edge-connectivity gone up?" while edges are inserted.
+
+    The oracle keeps a Gomory-Hu tree of the graph. Every tree edge stands for a
+    concrete cut of the graph, and a new edge (u, v) crosses exactly the cuts of the
+    tree edges on the u-v tree path, so an insertion only bumps the values along that
+    path. While some tree cut still has value lambda the answer is certainly "no";
+    once every tree cut has been crossed a single threshold check confirms the increase
+    (the tree is rebuilt if other minimum cuts remain).
+    """
+
+    def __init__(self, G, tree=None):
+        self.graph = G
+        self.flow_checks = 0
+        self._rebuild(tree)
+
+    def _rebuild(self, tree=None):
+        """Rebuild the cut tree, or adopt `tree` when one of the current graph is at hand."""
+        self._stale = False
+        if self.graph.number_of_nodes() < 2:
+            self._parent, self._depth, self._cut_value = {}, {}, {}
+            self._connectivity = 0
+            self._tight = 0
+            return
+        if tree is None:
+            T = build_cut_tree(self.graph)
+            self.flow_checks += T.number_of_nodes() - 1
+        else:
+            T = tree
+        self._parent, self._depth = root_cut_tree(T)
+        self._cut_value = {
+            v: T[v][p]["weight"] for v, p in self._parent.items() if p is not None
+        }
+        self._connectivity = min(self._cut_value.values(), default=0)
+        # Number of tree cuts that still sit at the current connectivity
+        self._tight = sum(1 for w in self._cut_value.values() if w == self._connectivity)
+
+    @property
+    def connectivity(self):
+        """Current edge-connectivity of the graph."""
+        return self._connectivity
+
+    def add_edge(self, u, v):
+        """Insert (u, v) into the graph and update the cuts it crosses."""
+        if self._stale or u not in self._depth or v not in self._depth:
+            add_parallel_edge(self.graph, u, v)
+            self._rebuild()
+            return
+        add_parallel_edge(self.graph, u, v)
+        for node in tree_path_nodes(self._parent, self._depth, u, v):
+            if self._cut_value[node] == self._connectivity:
+                self._tight -= 1
+            self._cut_value[node] += 1
+
+        if self._tight == 0:
+            self._confirm_increase()
+
+    def _confirm_increase(self):
+        """All tree cuts were crossed; check whether another minimum cut survives."""
+        target = self._connectivity + 1
+        self.flow_checks += 1
+        if edge_connectivity_at_least(self.graph, target):
+            # A single edge raises connectivity by at most one
+            self._connectivity = target
+            self._stale = True
+        else:
+            self._rebuild()
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from collections import OrderedDict
+
+import networkx as nx
+from augmentation import AugmentationResult, augment_connectivity
+from compact_graph import CompactGraph
+from connectivity import edge_connectivity_at_least
+from tracing import count, tracing
+
+# Stored edges (graph + new) the in-memory tier holds before evicting
+MAX_CACHED_EDGES = 1_000_000
+
+
+def _sorted(items):
+    try:
+        return sorted(items)
+    except TypeError:
+        return sorted(items, key=repr)
+
+
+def canonical_edges(edges):
+    """(vertices, edges) in a label-dependent canonical order: each edge as (min, max), all sorted."""
+    if isinstance(edges, CompactGraph):
+        nodes, edges = list(edges.nodes()), list(edges.edges())
+    else:
+        edges = list(edges)
+        nodes = [u for edge in edges for u in edge]
+    pairs = {tuple(_sorted(edge)) for edge in edges}
+    return _sorted(set(nodes)), _sorted(pairs)
+
+
+def fingerprint(edges, k, target):
+    """Exact key: a hash of the sorted edge set, the vertex set, k and target."""
+    nodes, pairs = canonical_edges(edges)
+    digest = hashlib.sha256(repr((k, target, nodes, pairs)).encode())
+    return "exact-" + digest.hexdigest()
+
+
+def invariant_fingerprint(G, k, target):
+    """Relabelling-invariant key (Weisfeiler-Lehman hash); hits must still be verified."""
+    with warnings.catch_warnings():
+        # networkx >= 3.5 warns that attribute-free hashes changed; ours are only compared with each other
+        warnings.simplefilter("ignore", UserWarning)
+        wl = nx.weisfeiler_lehman_graph_hash(G, iterations=3)
+    return f"iso-{k}-{target}-{G.number_of_nodes()}-{G.number_of_edges()}-{wl}"
+
+
+def _as_label(value):
+    """JSON turns tuple labels into lists; turn them back."""
+    return tuple(_as_label(v) for v in value) if isinstance(value, list) else value
+
+
+class ResultCache:
+    """
+    Content-addressed cache in front of augment_connectivity.
+
+    Entries are keyed by `fingerprint` (same labels, same edges). With
+    `invariant`, a second key from `invariant_fingerprint` also catches
+    relabelled copies: the stored graph is matched to the caller's with a VF2++
+    isomorphism and the cached new edges are translated through that mapping.
+    The in-memory tier is an LRU bounded by stored edges; with `directory`,
+    entries are also written there as JSON (atomically, so several processes
+    can share it).
+    """
+
+    def __init__(self, max_edges=MAX_CACHED_EDGES, directory=None, invariant=False):
+        self.max_edges = max_edges
+        self.directory = directory
+        self.invariant = invariant
+        self._entries = OrderedDict()
+        self._size = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def _load(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self.directory and os.path.exists(self._path(key)):
+            with open(self._path(key)) as f:
+                raw = json.load(f)
+            entry = {name: [tuple(_as_label(u) for u in edge) for edge in raw[name]]
+                     for name in ("edges", "new_edges")}
+            entry["lower_bound"] = raw.get("lower_bound")
+            entry["levels"] = raw.get("levels", [])
+            self._remember(key, entry)
+            return entry
+        return None
+
+    def _remember(self, key, entry):
+        if key in self._entries:
+            return
+        self._entries[key] = entry
+        self._size += len(entry["edges"]) + len(entry["new_edges"])
+        while self._size > self.max_edges and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            self._size -= len(old["edges"]) + len(old["new_edges"])
+
+    def _store(self, key, entry):
+        self._remember(key, entry)
+        if self.directory:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp, self._path(key))
+
+    def get(self, edges, k, target=None):
+        """Cached new edges for (edges, k, target) in the caller's labels, or None."""
+        hit = self._lookup(edges, k, target)
+        return None if hit is None else hit[0]
+
+    def _lookup(self, edges, k, target):
+        """(new edges in the caller's labels, stored entry) on a hit, else None."""
+        target = k + 1 if target is None else target
+        entry = self._load(fingerprint(edges, k, target))
+        if entry is not None:
+            count("cache.exact_hits")
+            return list(entry["new_edges"]), entry
+        if not self.invariant:
+            return None
+        G = self._graph(edges)
+        entry = self._load(invariant_fingerprint(G, k, target))
+        if entry is None:
+            return None
+        mapping = nx.vf2pp_isomorphism(nx.Graph(entry["edges"]), G)
+        if mapping is None:
+            count("cache.collisions")
+            return None
+        count("cache.invariant_hits")
+        return [(mapping[u], mapping[v]) for u, v in entry["new_edges"]], entry
+
+    def put(self, edges, k, target, new_edges, lower_bound=None, levels=None):
+        target = k + 1 if target is None else target
+        _, pairs = canonical_edges(edges)
+        entry = {"edges": pairs, "new_edges": [tuple(e) for e in new_edges],
+                 "lower_bound": lower_bound, "levels": [] if levels is None else levels}
+        self._store(fingerprint(edges, k, target), entry)
+        if self.invariant:
+            self._store(invariant_fingerprint(self._graph(edges), k, target), entry)
+
+    @staticmethod
+    def _graph(edges):
+        return edges.to_networkx() if isinstance(edges, CompactGraph) else nx.Graph(edges)
+
+    def augment(self, edges, k, target=None, trace=None, **options):
+        """
+        augment_connectivity(edges, k, target=target, **options) through the
+        cache. A hit returns the cached edges applied to the caller's graph, with
+        the stored lower bound and level records, and the trace records it; a
+        miss runs the pipeline and stores its edges, bound and levels. Answers
+        that are not final (an anytime run cut short by its deadline, or one
+        that misses the target) are returned but never stored, so the key does
+        not need the options.
+        """
+        if not isinstance(edges, CompactGraph):
+            edges = list(edges)
+        with tracing(trace) as trace:
+            hit = self._lookup(edges, k, target)
+            if hit is not None:
+                new_edges, entry = hit
+                G = edges.copy() if isinstance(edges, CompactGraph) else nx.Graph(edges)
+                G.add_edges_from(new_edges)
+                return AugmentationResult(G, new_edges, list(entry["levels"]), trace, entry["lower_bound"])
+            count("cache.misses")
+            result = augment_connectivity(edges, k, target=target, trace=trace, **options)
+            final = (getattr(result, "complete", True)
+                     and edge_connectivity_at_least(result.graph, k + 1 if target is None else target))
+            if not final:
+                count("cache.not_stored")
+                return result
+        self.put(edges, k, target, result.new_edges, result.lower_bound, result.levels)
+        return result
@@ -0,0 +1,86 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from connectivity import edge_connectivity_at_least
+from tracing import checkpoint, count
+
+# Below this many edges one connectivity check is cheaper than starting a pool
+PARALLEL_MIN_EDGES = 20000
+
+# Read-only state of a pool worker, set once by _init_worker
+_shared = {}
+
+
+def _prefix_reaches(G, candidates, i, target):
+    H = G.copy()
+    H.add_edges_from(candidates[:i])
+    return edge_connectivity_at_least(H, target)
+
+
+def _init_worker(G, candidates, target):
+    _shared["args"] = (G, candidates, target)
+
+
+def _check_in_worker(i):
+    G, candidates, target = _shared["args"]
+    return _prefix_reaches(G, candidates, i, target)
+
+
+def resolve_workers(workers):
+    """None means every core; anything below 1 means 1."""
+    return max(os.cpu_count() or 1, 1) if workers is None else max(workers, 1)
+
+
+def first_improving_prefix(G, candidates, target, workers=1):
+    """
+    Smallest i such that adding candidates[:i] to G gives connectivity >= target,
+    or None when even all of them do not.
+
+    Adding edges never lowers the connectivity, so the answer is the same prefix
+    the one-edge-at-a-time loop stops at, found with O(log L) checks instead of L.
+    With several workers (and a graph large enough to pay for a pool) each round
+    checks `workers` prefixes speculatively in parallel; every worker receives the
+    graph and the candidates once, and each task is just a prefix length.
+    """
+    total = len(candidates)
+    if total == 0:
+        return None
+    workers = resolve_workers(workers)
+    if workers > 1 and G.number_of_edges() >= PARALLEL_MIN_EDGES and total > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, total), initializer=_init_worker,
+                                 initargs=(G, candidates, target)) as pool:
+            return _search(total, workers, lambda points: list(pool.map(_check_in_worker, points)))
+    return _search(total, 1, lambda points: [_prefix_reaches(G, candidates, i, target) for i in points])
+
+
+def _search(total, width, check):
+    """
+    Narrow (lo, hi] to the first passing prefix: prefixes <= lo fail, prefix hi passes.
+    Each round checks up to `width` evenly spaced prefixes; the full prefix goes
+    along with the first round.
+    """
+    lo, hi = 0, None
+    points = _split(0, total, width - 1) + [total]
+    while True:
+        checkpoint()
+        count("prefix_checks", len(points))
+        for point, ok in zip(points, check(points)):
+            if ok:
+                hi = point
+                break
+            lo = point
+        if hi is None:
+            return None
+        if hi - lo <= 1:
+            return hi
+        points = _split(lo, hi, width)
+
+
+def _split(lo, hi, width):
+    """Up to `width` distinct prefix lengths strictly between lo and hi, in order."""
+    gap = hi - lo - 1
+    if gap <= 0 or width <= 0:
+        return []
+    if gap <= width:
+        return list(range(lo + 1, hi))
+    return sorted({lo + (hi - lo) * (j + 1) // (width + 1) for j in range(width)})
@@ -1,11 +1,42 @@
 from augmentation import augment_graph_via_matching
-from connectivity import is_k_plus_1_edge_connected
+from batch import run_batch
+from benchmark import compare, run_suite
+from connectivity import is_k_plus_1_edge_connected, compute_edge_connectivity, edge_connectivity_at_least
 from graph_utils import generate_graph_from_edges
 from itertools import combinations
 from augmentation import augment_connectivity
+from anytime import anytime_augmentation, augment_connectivity_async
+import asyncio
+import threading
+import time
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 from graph_utils import verify_augmentation
+from graph_io import load_csr, load_graph, save_csr
+from lower_bounds import degree_bound, extreme_set_bound, lower_bound
+from candidate_scoring import pairwise_distances, score_candidates
+from certificate import certificate_graph, is_tree_packing, tree_packing
+from compact_graph import CompactGraph, as_networkx
+from complement import ComplementView
+from contraction import contract_components
+from context import AugmentationContext
+from decomposition import bridge_blocks, decomposed_augmentation
+from dynamic import DynamicAugmenter
+from exact_augmentation import augment_by_one, minimal_tight_sets
+from generator import generate_graph
+from matching import compute_maximum_matching
+from min_cuts import ConnectivityOracle, MinCutStructure
+from result_cache import ResultCache
+from speculative import first_improving_prefix
+import speculative
+import augmentation
+from tracing import current_trace, tracing
+import visualize
 import networkx as nx
+import numpy as np
 
 
 class TestEdgeConnectivityAugmentation(unittest.TestCase):
@@ -30,11 +61,538 @@ class TestEdgeConnectivityAugmentation(unittest.TestCase):
         # Graph where complement has no perfect matching
         edges = [(0,1), (1,2), (2,3), (3,4), (4,5), (5,0), (0,2), (3,5)]
         k = 2
-        # new_edges = augment_connectivity(edges, k)
-        G_aug, new_edges = augment_connectivity(edges, k)
+        result = augment_connectivity(edges, k)
 
-        self.assertTrue(verify_augmentation(edges, new_edges, k))
-        self.assertTrue(2 <= len(new_edges) <= 3)
+        self.assertTrue(verify_augmentation(edges, result.new_edges, k))
+        # (1, 4) joins the two triangles' degree-2 vertices; one edge is optimal
+        self.assertEqual(result.lower_bound, 1)
+        self.assertEqual(result.gap, 0)
+
+
+class TestConnectivityOracle(unittest.TestCase):
+    def test_tracks_connectivity_after_insertions(self):
+        G = nx.cycle_graph(6)
+        oracle = ConnectivityOracle(G)
+        self.assertEqual(oracle.connectivity, 2)
+        for u, v in [(0, 3), (1, 4), (2, 5)]:
+            oracle.add_edge(u, v)
+            self.assertEqual(oracle.connectivity, nx.edge_connectivity(G))
+        self.assertEqual(oracle.connectivity, 3)
+
+    def test_adopts_existing_cut_tree(self):
+        G = nx.cycle_graph(6)
+        oracle = ConnectivityOracle(G, tree=MinCutStructure(G).tree)
+        self.assertEqual((oracle.connectivity, oracle.flow_checks), (2, 0))
+        for u, v in [(0, 3), (1, 4), (2, 5)]:
+            oracle.add_edge(u, v)
+        self.assertEqual(oracle.connectivity, 3)
+
+    def test_min_cut_edges_on_small_graph(self):
+        # Two triangles joined by a single bridge: the bridge is the only bottleneck
+        G = nx.Graph([(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (2, 3)])
+        cuts = MinCutStructure(G)
+        self.assertEqual(cuts.connectivity, 1)
+        self.assertEqual([set(e) for e in cuts.bottleneck_edges()], [{2, 3}])
+
+
+class TestComplementView(unittest.TestCase):
+    def test_matching_on_implicit_complement(self):
+        G = nx.cycle_graph(6)
+        view = ComplementView(G, [0, 1, 2, 3])
+        self.assertTrue(view.has_edge(0, 2))
+        self.assertFalse(view.has_edge(0, 1))
+        self.assertEqual(view.number_of_edges(), nx.complement(G.subgraph([0, 1, 2, 3])).number_of_edges())
+        matching = compute_maximum_matching(view)
+        self.assertEqual(len(matching), 2)
+        self.assertTrue(all(view.has_edge(u, v) for u, v in matching))
+
+
+class TestCompactGraph(unittest.TestCase):
+    def test_snapshot_and_pipeline(self):
+        edges = [(0,1), (1,2), (2,3), (3,0)]
+        C = CompactGraph.from_edges(edges)
+        snapshot = C.copy()
+        snapshot.add_edge(0, 2)
+        self.assertFalse(C.has_edge(0, 2))
+        self.assertTrue(snapshot.has_edge(2, 0))
+        self.assertEqual(snapshot.number_of_edges(), 5)
+
+        G_aug, new_edges = augment_connectivity(C, 2)
+        self.assertIsInstance(G_aug, CompactGraph)
+        self.assertEqual(len(new_edges), 2)
+        self.assertTrue(verify_augmentation(edges, new_edges, 2))
+
+    def test_conversions_are_built_once(self):
+        G = nx.gnp_random_graph(30, 0.3, seed=4)
+        C = CompactGraph.from_networkx(G)
+        view = as_networkx(C)
+        self.assertIs(as_networkx(C), view)
+        self.assertIs(C.adjacency(), C.adjacency())
+        self.assertTrue(nx.is_frozen(view))
+        expected = nx.edge_connectivity(G)
+        for backend in ("flow", "stoer_wagner", "nagamochi_ibaraki"):
+            self.assertEqual(compute_edge_connectivity(C, backend=backend), expected)
+        u = min(G.nodes(), key=G.degree)
+        v = next(w for w in G.nodes() if w != u and not G.has_edge(u, w))
+        C.add_edge(u, v)
+        self.assertIsNot(as_networkx(C), view)
+        self.assertTrue(as_networkx(C).has_edge(u, v))
+        self.assertEqual(sum(len(row) for row in C.adjacency()), 2 * G.number_of_edges() + 2)
+
+
+class TestConnectivityEngine(unittest.TestCase):
+    def test_backends_agree(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(12, 0.5, seed=seed)
+            expected = nx.edge_connectivity(G)
+            for backend in ("flow", "stoer_wagner", "nagamochi_ibaraki", "auto"):
+                self.assertEqual(compute_edge_connectivity(G, backend=backend), expected)
+            self.assertGreaterEqual(compute_edge_connectivity(G, backend="karger_stein", seed=seed), expected)
+            self.assertTrue(edge_connectivity_at_least(G, expected))
+            self.assertFalse(edge_connectivity_at_least(G, expected + 1))
+
+    def test_unrelated_weights_are_ignored(self):
+        # Distances on a user graph are not edge multiplicities
+        G = nx.cycle_graph(6)
+        nx.set_edge_attributes(G, 0.5, "weight")
+        self.assertEqual(compute_edge_connectivity(G, backend="nagamochi_ibaraki"), 2)
+        self.assertTrue(edge_connectivity_at_least(G, 2))
+        G.graph["weighted"] = True
+        nx.set_edge_attributes(G, 2, "weight")
+        self.assertEqual(compute_edge_connectivity(G), 4)
+
+
+class TestSparseCertificate(unittest.TestCase):
+    def test_certificate_keeps_low_cuts(self):
+        G = nx.complete_graph(12)
+        G.remove_edges_from([(0, v) for v in range(3, 12)])  # vertex 0 has degree 2
+        H = certificate_graph(G, 3)
+        self.assertLessEqual(H.number_of_edges(), 3 * (G.number_of_nodes() - 1))
+        self.assertEqual(nx.edge_connectivity(H), nx.edge_connectivity(G))
+
+        G_aug, new_edges = augment_connectivity(list(G.edges()), 2)
+        self.assertTrue(all(not G.has_edge(u, v) for u, v in new_edges))
+        self.assertTrue(verify_augmentation(list(G.edges()), new_edges, 2))
+
+
+class TestLowerBounds(unittest.TestCase):
+    def test_simple_graph_correction(self):
+        # The two degree-2 vertices are adjacent, so one edge cannot serve both
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 0), (6, 1)])
+        self.assertEqual(degree_bound(G, 3), 2)
+        result = augment_connectivity(list(G.edges()), 2)
+        self.assertEqual((len(result.new_edges), result.gap), (2, 0))
+
+    def test_extreme_sets(self):
+        # Both K4s are tight sets although every degree is already 3
+        G = nx.disjoint_union(nx.complete_graph(4), nx.complete_graph(4))
+        G.add_edges_from([(0, 4), (1, 5)])
+        self.assertEqual(degree_bound(G, 3), 0)
+        self.assertEqual(extreme_set_bound(G, 3), 1)
+        with tracing() as trace:
+            self.assertEqual(lower_bound(G, 3, at_most=0), 0)
+        self.assertEqual(trace.counters["lower_bound.early_exits"], 1)
+        self.assertEqual(augment_connectivity(list(G.edges()), 2).lower_bound, 1)
+
+    def test_multi_level_target_is_reached(self):
+        # lambda = 3 -> 6 on 10 vertices: the exact engine and the greedy stages
+        # are blocked by existing edges, and the answer used to stop at 5
+        edges = [(0, 3), (0, 4), (0, 5), (0, 6), (0, 8), (1, 2), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8),
+                 (2, 3), (2, 6), (2, 8), (3, 4), (3, 7), (3, 8), (3, 9), (4, 5), (4, 7), (4, 8), (5, 7),
+                 (5, 8), (5, 9), (7, 9), (8, 9)]
+        result = augment_connectivity(edges, 3, target=6)
+        self.assertTrue(result.reached)
+        self.assertTrue(all(record["reached"] for record in result.levels))
+        self.assertEqual(compute_edge_connectivity(result.graph), 6)
+        self.assertGreaterEqual(result.gap, 0)
+
+    def test_no_bound_for_an_answer_short_of_the_target(self):
+        # Stages that add nothing must not pass for a provably optimal answer
+        with mock.patch.object(augmentation, "augment_graph", lambda G, k, ctx=None: (G, [])):
+            result = augment_connectivity(list(nx.cycle_graph(8).edges()), 2)
+        self.assertEqual(result.new_edges, [])
+        self.assertIsNone(result.gap)
+        self.assertFalse(result.reached)
+        self.assertFalse(result.levels[-1]["reached"])
+        self.assertEqual(result.trace.counters["lower_bound.incomplete"], 1)
+
+
+class TestVerification(unittest.TestCase):
+    def test_methods_agree(self):
+        for seed in range(20):
+            G = nx.gnp_random_graph(10, 0.6, seed=seed)
+            for k in range(4):
+                expected = verify_augmentation(G.edges(), [], k)
+                self.assertEqual(verify_augmentation(G.edges(), [], k, method="certificate"), expected)
+                self.assertEqual(verify_augmentation(G.edges(), [], k, method="sampled", samples=9), expected)
+
+    def test_tree_packing_proof(self):
+        G = nx.complete_graph(14)
+        G.add_edges_from([(14, 0), (14, 1), (14, 2)])  # a degree-3 vertex is a leaf of every tree
+        trees = tree_packing(G, 3)
+        self.assertTrue(is_tree_packing(G, trees))
+        self.assertFalse(is_tree_packing(G, [trees[0], trees[0], trees[1]]))
+        with tracing() as trace:
+            self.assertTrue(verify_augmentation(G.edges(), [], 2, method="certificate"))
+        self.assertEqual(trace.counters["verify.packing_proofs"], 1)
+
+
+class TestContraction(unittest.TestCase):
+    def test_two_cliques_joined_by_two_edges(self):
+        G = nx.disjoint_union(nx.complete_graph(6), nx.complete_graph(6))
+        G.add_edges_from([(0, 6), (1, 7)])
+        H, members = contract_components(G, 2)
+        self.assertEqual(H.number_of_nodes(), 2)
+        self.assertEqual(sorted(len(m) for m in members.values()), [6, 6])
+
+        G_aug, new_edges = augment_connectivity(list(G.edges()), 2)
+        self.assertEqual(len(new_edges), 1)
+        self.assertTrue(verify_augmentation(list(G.edges()), new_edges, 2))
+
+    def test_ring_of_cliques_is_optimal(self):
+        # Six K4s in a ring: every clique is a tight set, so three edges suffice
+        G = nx.Graph()
+        for i in range(6):
+            G.add_edges_from((4 * i + a, 4 * i + b) for a, b in combinations(range(4), 2))
+            G.add_edge(4 * i + 3, (4 * i + 4) % 24)
+        result = augment_connectivity(list(G.edges()), 2)
+        self.assertEqual((len(result.new_edges), result.gap), (3, 0))
+        self.assertTrue(verify_augmentation(list(G.edges()), result.new_edges, 2))
+
+
+class TestMatchingEngine(unittest.TestCase):
+    def test_warm_start_reaches_maximum(self):
+        G = nx.petersen_graph()
+        matching = compute_maximum_matching(G)
+        self.assertEqual(len(matching), 5)
+        # A stale seed (one pair is no longer an edge) still gives a maximum matching
+        G.remove_edge(*matching[0])
+        reseeded = compute_maximum_matching(G, initial_matching=matching)
+        self.assertEqual(len(reseeded), len(nx.max_weight_matching(G, maxcardinality=True)))
+        self.assertTrue(all(G.has_edge(u, v) for u, v in reseeded))
+
+
+class TestAugmentationContext(unittest.TestCase):
+    def test_artifacts_are_memoised_and_invalidated(self):
+        G = nx.cycle_graph(6)
+        ctx = AugmentationContext(G, 2)
+        self.assertIs(ctx.matching, ctx.matching)
+        self.assertEqual(ctx.connectivity, 2)
+        self.assertEqual(len(ctx.vertices_k), 6)
+
+        ctx.add_edges_from([(0, 3), (1, 4), (2, 5)])
+        self.assertEqual(ctx.version, 1)
+        self.assertEqual(ctx.connectivity, 3)
+        self.assertEqual(ctx.vertices_k, [])
+
+
+class TestMultiLevelAugmentation(unittest.TestCase):
+    def test_target_raises_several_levels(self):
+        edges = list(nx.cycle_graph(8).edges())
+        result = augment_connectivity(edges, 2, target=4)
+        G_aug, new_edges = result
+        self.assertEqual(nx.edge_connectivity(G_aug), 4)
+        self.assertEqual([level["level"] for level in result.levels], [3, 4])
+        self.assertEqual(sum(level["edges"] for level in result.levels), len(new_edges))
+        self.assertTrue(verify_augmentation(edges, new_edges, 3))
+
+    def test_set_k_keeps_graph_artifacts(self):
+        ctx = AugmentationContext(nx.cycle_graph(6), 2)
+        cuts = ctx.min_cuts
+        ctx.set_k(3)
+        self.assertIs(ctx.min_cuts, cuts)
+        self.assertEqual(ctx.vertices_k, [])
+
+class TestTracing(unittest.TestCase):
+    def test_counters_and_phases_on_result(self):
+        result = augment_connectivity(list(nx.cycle_graph(7).edges()), 2)
+        trace = result.trace
+        self.assertGreater(trace.counters["connectivity_checks"], 0)
+        self.assertGreater(trace.counters["candidate_edges"], 0)
+        self.assertIn("level", trace.phases)
+        self.assertEqual(set(trace.as_dict()), {"counters", "values", "phases"})
+
+    def test_disabled_outside_a_run(self):
+        self.assertIsNone(current_trace())
+        with tracing() as trace:
+            compute_edge_connectivity(nx.cycle_graph(5))
+        self.assertEqual(trace.counters, {"connectivity_checks": 1})
+
+class TestDecomposition(unittest.TestCase):
+    def test_bridge_blocks_and_optimal_join(self):
+        # Two triangles joined by a bridge, and a separate path: four leaf blocks, so two edges
+        G = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5), (5, 3), (6, 7), (7, 8)])
+        blocks, _, bridges = bridge_blocks(G)
+        self.assertEqual(len(blocks), 5)
+        self.assertEqual(len(bridges), 3)
+        edges = decomposed_augmentation(G, 2)
+        G.add_edges_from(edges)
+        self.assertEqual(len(edges), 2)
+        self.assertEqual(nx.edge_connectivity(G), 2)
+
+    def test_disconnected_input_through_augment_connectivity(self):
+        edges = [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3)]
+        result = augment_connectivity(edges, 2)
+        self.assertEqual(result.levels[0]["stage"], "decomposition")
+        self.assertTrue(verify_augmentation(edges, result.new_edges, 2))
+
+class TestSpeculativeSearch(unittest.TestCase):
+    def test_matches_one_at_a_time_loop(self):
+        G = nx.cycle_graph(10)
+        candidates = [(0, 5), (2, 7), (1, 6), (3, 8), (4, 9), (0, 2)]
+        sequential = None
+        H = G.copy()
+        for i, edge in enumerate(candidates, 1):
+            H.add_edge(*edge)
+            if compute_edge_connectivity(H) >= 3:
+                sequential = i
+                break
+        self.assertEqual(first_improving_prefix(G, candidates, 3), sequential)
+        self.assertIsNone(first_improving_prefix(G, candidates[:2], 3))
+
+        with mock.patch.object(speculative, "PARALLEL_MIN_EDGES", 0):
+            self.assertEqual(first_improving_prefix(G, candidates, 3, workers=2), sequential)
+
+class TestCandidateScoring(unittest.TestCase):
+    def test_batched_distances_and_ranking(self):
+        G = nx.gnp_random_graph(80, 0.04, seed=3)
+        vertices = list(G.nodes())[::2]
+        D = pairwise_distances(CompactGraph.from_networkx(G), vertices)
+        for i, u in enumerate(vertices):
+            lengths = nx.single_source_shortest_path_length(G, u)
+            self.assertEqual(D[i].tolist(), [lengths.get(v, -1) for v in vertices])
+
+        ranked = score_candidates(nx.path_graph(5), range(5))
+        self.assertEqual(ranked[0], (0, 4, 4.0))
+        self.assertEqual(len(ranked), 6)  # unordered, non-adjacent pairs only
+        ranked = score_candidates(nx.path_graph(5), range(5), [{0, 1}],
+                                  weights={"distance": 0, "cut_separation": 1})
+        self.assertEqual({(u, v) for u, v, s in ranked if s == 1}, {(0, 2), (0, 3), (0, 4), (1, 3), (1, 4)})
+        for limit in (1, 3, 5, 40):
+            self.assertEqual(score_candidates(G, vertices, limit=limit), score_candidates(G, vertices)[:limit])
+
+class TestGenerator(unittest.TestCase):
+    def test_prescribed_connectivity_and_degree_k_count(self):
+        for k, degree_k, avg_degree in [(1, 5, 4), (2, 10, None), (3, 7, 8), (4, 1, 12)]:
+            G = generate_graph(60, k, degree_k, avg_degree, seed=k).to_networkx()
+            self.assertEqual(G.number_of_nodes(), 60)
+            self.assertEqual(nx.edge_connectivity(G), k)
+            self.assertEqual(sum(1 for _, d in G.degree() if d == k), degree_k)
+        self.assertEqual(sorted(generate_graph(30, 3, seed=1).edges()),
+                         sorted(generate_graph(30, 3, seed=1).edges()))
+        with self.assertRaises(ValueError):
+            generate_graph(10, 3, degree_k=9)
+
+class TestDynamicAugmenter(unittest.TestCase):
+    def test_updates_keep_target_connectivity(self):
+        G = generate_graph(40, 2, degree_k=6, avg_degree=5, seed=4).to_networkx()
+        dynamic = DynamicAugmenter(G.edges(), 2)
+        rng = np.random.default_rng(0)
+        for step in range(30):
+            edges = list(dynamic.graph.edges())
+            if step % 2:
+                dynamic.delete_edge(*edges[rng.integers(len(edges))])
+            elif step % 10 == 0:
+                dynamic.insert_edge(0, f"new{step}")
+            else:
+                u, v = rng.choice(40, 2, replace=False).tolist()
+                dynamic.insert_edge(u, v)
+            H = dynamic.graph.copy()
+            H.add_edges_from(dynamic.augmenting_edges())
+            self.assertGreaterEqual(nx.edge_connectivity(H), 3)
+            self.assertFalse(any(dynamic.graph.has_edge(u, v) for u, v in dynamic.augmenting_edges()))
+            # The matching is updated in place and stays a maximal complement matching
+            matched = {u for pair in dynamic.matching for u in pair}
+            self.assertTrue(all(a in dynamic.vertices_k and b in dynamic.vertices_k
+                                and not dynamic.graph.has_edge(a, b) for a, b in dynamic.matching))
+            free = dynamic.vertices_k - matched
+            self.assertFalse(any(a != b and not dynamic.graph.has_edge(a, b) for a in free for b in free))
+        self.assertEqual(dynamic.vertices_k, {u for u, d in dynamic.graph.degree() if d == 2})
+        view = ComplementView(dynamic.graph, list(dynamic.vertices_k))
+        dynamic.resolve()
+        self.assertEqual(len(dynamic.matching), len(compute_maximum_matching(view)))
+
+        # With target > k + 1 the tracked set is still the degree-k vertices
+        dynamic = DynamicAugmenter(nx.cycle_graph(8).edges(), 2, target=4)
+        dynamic.delete_edge(0, 1)
+        H = dynamic.graph.copy()
+        H.add_edges_from(dynamic.augmenting_edges())
+        self.assertGreaterEqual(nx.edge_connectivity(H), 4)
+        self.assertEqual(dynamic.vertices_k, set(range(2, 8)))
+
+class TestAnytimeAugmentation(unittest.TestCase):
+    def test_interrupted_runs_return_valid_answers(self):
+        # Two hexagons joined by two edges: the matching seed is not enough
+        edges = [(i, (i + 1) % 6) for i in range(6)] + [(6 + i, 6 + (i + 1) % 6) for i in range(6)]
+        edges += [(0, 6), (3, 9)]
+        cancel = threading.Event()
+        cancel.set()
+        result = anytime_augmentation(edges, 2, cancel=cancel)
+        self.assertFalse(result.complete)
+        self.assertTrue(verify_augmentation(edges, result.new_edges, 2))
+        self.assertGreater(result.gap, 0)
+
+        result = augment_connectivity(edges, 2, time_budget=10)
+        self.assertTrue(result.complete)
+        self.assertTrue(verify_augmentation(edges, result.new_edges, 2))
+        self.assertEqual((len(result.new_edges), result.lower_bound), (4, 4))
+
+        # The nested pipeline run records into the same trace
+        result = anytime_augmentation(edges, 2)
+        self.assertEqual(result.trace.counters.get("anytime.pipeline"), 1)
+        self.assertIn("level", result.trace.phases)
+
+    def test_small_budget_bounds_the_seeds_too(self):
+        edges = list(nx.cycle_graph(500).edges())
+        start = time.monotonic()
+        result = anytime_augmentation(edges, 2, time_budget=0.05)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertFalse(result.complete)
+        self.assertTrue(verify_augmentation(edges, result.new_edges, 2, method="certificate"))
+
+    def test_async_variant(self):
+        edges = list(nx.cycle_graph(8).edges())
+        result = asyncio.run(augment_connectivity_async(edges, 2, time_budget=10))
+        self.assertEqual(len(result.new_edges), result.lower_bound)
+
+class TestVisualization(unittest.TestCase):
+    def test_layout_cached_and_complement_sampled(self):
+        G = nx.random_regular_graph(3, visualize.LARGE_GRAPH_NODES + 100, seed=2)
+        pos = visualize.layout(G)
+        self.assertIs(visualize.layout(G.copy()), pos)
+        self.assertEqual(len(pos), G.number_of_nodes())
+        # Same vertices, different edges: not the stale layout
+        H = G.copy()
+        H.add_edge(0, 7)
+        self.assertIsNot(visualize.layout(H), pos)
+
+        sample = visualize.complement_sample(G, limit=50)
+        self.assertEqual(len({frozenset(e) for e in sample}), 50)
+        self.assertFalse(any(G.has_edge(u, v) for u, v in sample))
+        self.assertEqual(visualize.complement_sample(nx.path_graph(4)), [(0, 2), (0, 3), (1, 3)])
+
+class TestResultCache(unittest.TestCase):
+    def test_exact_and_relabelled_hits(self):
+        edges = list(nx.cycle_graph(10).edges())
+        with tempfile.TemporaryDirectory() as tmp:
+            first = ResultCache(directory=tmp, invariant=True).augment(edges, 2)
+
+            # A fresh cache (another process) finds the entry on disk
+            cache = ResultCache(directory=tmp, invariant=True)
+            again = cache.augment(reversed(edges), 2)
+            self.assertEqual(again.new_edges, first.new_edges)
+            self.assertEqual(again.trace.counters, {"cache.exact_hits": 1})
+            self.assertEqual((again.lower_bound, again.gap), (first.lower_bound, 0))
+            self.assertEqual([r["stage"] for r in again.levels], [r["stage"] for r in first.levels])
+
+            names = {i: f"v{(3 * i) % 10}" for i in range(10)}
+            relabelled = [(names[u], names[v]) for u, v in edges]
+            result = cache.augment(relabelled, 2)
+            self.assertEqual(result.trace.counters, {"cache.invariant_hits": 1})
+            self.assertEqual(len(result.new_edges), len(first.new_edges))
+            self.assertEqual(compute_edge_connectivity(result.graph), 3)
+
+        # An anytime answer cut short is returned but never served to a full request
+        hexagons = [(i, (i + 1) % 6) for i in range(6)] + [(6 + i, 6 + (i + 1) % 6) for i in range(6)]
+        hexagons += [(0, 6), (3, 9)]
+        cache = ResultCache()
+        rushed = cache.augment(hexagons, 2, time_budget=0)
+        self.assertFalse(rushed.complete)
+        self.assertEqual(rushed.trace.counters["cache.not_stored"], 1)
+        full = cache.augment(hexagons, 2)
+        self.assertEqual(full.trace.counters["cache.misses"], 1)
+        self.assertEqual(len(full.new_edges), 4)
+
+        small = ResultCache(max_edges=25)
+        for n in (6, 8, 10):
+            small.augment(list(nx.cycle_graph(n).edges()), 2)
+        self.assertEqual(len(small), 1)
+
+class TestGraphIO(unittest.TestCase):
+    def test_stream_cache_and_mmap_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph.txt")
+            with open(path, "w") as f:
+                f.write("# 8-cycle, with a weight column\n")
+                f.writelines(f"{i} {(i + 1) % 8} 1.0\n" for i in range(8))
+            load_graph(path)
+            self.assertFalse(os.path.exists(path + ".csr"))  # caching is opt-in
+            G = load_graph(path, cache=True)
+            self.assertTrue(os.path.isdir(path + ".csr"))
+            self.assertEqual(sorted(map(sorted, G.edges())), sorted(map(sorted, nx.cycle_graph(8).edges())))
+
+            cached = load_graph(path, cache=True)
+            self.assertIsInstance(cached._indices, np.memmap)
+
+            G_aug, new_edges = augment_connectivity(cached, 2)
+            save_csr(G_aug, os.path.join(tmp, "augmented.csr"))
+            reloaded = load_csr(os.path.join(tmp, "augmented.csr"))
+            self.assertEqual(reloaded.number_of_edges(), 8 + len(new_edges))
+            self.assertEqual(compute_edge_connectivity(reloaded), 3)
+
+            # Editing the source invalidates the cache
+            with open(path, "a") as f:
+                f.write("0 4 1.0\n")
+            edited = load_graph(path, cache=True)
+            self.assertNotIsInstance(edited._indices, np.memmap)
+            self.assertEqual(edited.number_of_edges(), 9)
+
+class TestBenchmark(unittest.TestCase):
+    def test_report_and_regression_gate(self):
+        report = run_suite([20, 40], families=["cycle"], memory=False)
+        self.assertEqual([(r["n"], r["lambda_after"]) for r in report["results"]], [(20, 3), (40, 3)])
+        self.assertIn("augment", report["results"][0]["stages"])
+
+        faster = json.loads(json.dumps(report))
+        for record in faster["results"]:
+            record["stages"]["augment"]["seconds"] /= 10
+        self.assertEqual(compare(report, report), [])
+        self.assertTrue(any(r["stage"] == "augment" for r in compare(report, faster, floor=0)))
+
+class TestBatchMode(unittest.TestCase):
+    def test_results_stream_in_input_order(self):
+        jobs = [
+            ("c4", [(0,1), (1,2), (2,3), (3,0)], 2),
+            ("k4", list(combinations(range(4), 2)), 3),
+            ("bad", [(0, 1)], "x"),
+        ]
+        records = list(run_batch(iter(jobs), workers=1))
+        self.assertEqual([r["id"] for r in records], ["c4", "k4", "bad"])
+        self.assertEqual(records[0]["lambda_after"], 3)
+        self.assertEqual(records[1]["added_edges"], [])
+        self.assertIn("error", records[2])
+
+
+class TestExactAugmentation(unittest.TestCase):
+    def test_meets_tight_set_lower_bound(self):
+        # Every vertex of C5 is a minimal tight set, so ceil(5/2) = 3 edges are needed
+        G = nx.cycle_graph(5)
+        self.assertEqual(sorted(map(sorted, minimal_tight_sets(G, 2))), [[0], [1], [2], [3], [4]])
+        new_edges = augment_by_one(G, 2)
+        self.assertEqual(len(new_edges), 3)
+        self.assertTrue(verify_augmentation(list(G.edges()), new_edges, 2))
+
+    def test_adjacent_tight_vertices_share_a_neighbour(self):
+        # 5 and 6 are the only tight sets and are adjacent: one edge each to K5
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 0), (6, 1)])
+        new_edges = augment_by_one(G, 2)
+        self.assertEqual(len(new_edges), 2)
+        self.assertTrue(verify_augmentation(list(G.edges()), new_edges, 2))
+
+    def test_blocked_by_existing_edges(self):
+        self.assertIsNone(augment_by_one(nx.complete_graph(4), 3))
+
+    def test_optimal_on_long_cycles_and_run_once_per_context(self):
+        G = nx.cycle_graph(200)
+        ctx = AugmentationContext(G, 2)
+        with tracing() as trace:
+            _, new_edges = augmentation.strategic_edge_addition(G, 2, ctx)
+            self.assertIs(augmentation.strategic_edge_addition(G, 2, ctx)[1], new_edges)
+        self.assertEqual(len(new_edges), 100)
+        self.assertTrue(verify_augmentation(list(G.edges()), new_edges, 2))
+        self.assertEqual(trace.as_dict()["phases"]["contracted_augmentation"]["calls"], 1)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,133 @@
+import functools
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+# Progress messages of every stage go through this logger. Nothing is formatted
+# unless a handler is enabled for the level, e.g. logging.basicConfig(level=logging.DEBUG).
+logger = logging.getLogger("augmentation")
+logger.addHandler(logging.NullHandler())
+
+
+class Trace:
+    """
+    Counters and per-phase wall-clock timers of one augmentation run.
+
+    Counters are plain integers (max-flow calls, connectivity checks, candidate
+    edges, fallbacks taken); `record` keeps the last value of a measurement such
+    as the matching size. Phases may nest; each name accumulates inclusive seconds
+    and the number of times it was entered. Subclass and override `count`,
+    `record` or `phase` to forward them elsewhere.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.values = {}
+        self.phases = {}
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def record(self, name, value):
+        self.values[name] = value
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds, calls = self.phases.get(name, (0.0, 0))
+            self.phases[name] = (seconds + time.perf_counter() - start, calls + 1)
+
+    def as_dict(self):
+        return {
+            "counters": dict(self.counters),
+            "values": dict(self.values),
+            "phases": {name: {"seconds": s, "calls": c} for name, (s, c) in self.phases.items()},
+        }
+
+    def __repr__(self):
+        return f"Trace(counters={self.counters}, values={self.values})"
+
+
+_active = ContextVar("augmentation_trace", default=None)
+
+
+@contextmanager
+def tracing(trace=None):
+    """Make `trace` (a new Trace by default) the target of count/record/phase in this context."""
+    trace = Trace() if trace is None else trace
+    token = _active.set(trace)
+    try:
+        yield trace
+    finally:
+        _active.reset(token)
+
+
+def current_trace():
+    return _active.get()
+
+
+def count(name, n=1):
+    """Bump a counter of the active trace; a no-op outside `tracing`."""
+    trace = _active.get()
+    if trace is not None:
+        trace.count(name, n)
+
+
+def record(name, value):
+    trace = _active.get()
+    if trace is not None:
+        trace.record(name, value)
+
+
+def phase(name):
+    """Time a block under `name` in the active trace; a no-op outside `tracing`."""
+    checkpoint()
+    trace = _active.get()
+    return nullcontext() if trace is None else trace.phase(name)
+
+
+class DeadlineExceeded(Exception):
+    """Raised by checkpoint() once the active deadline has passed or the run was cancelled."""
+
+
+# (deadline on the time.monotonic() clock or None, threading.Event-like cancel flag or None)
+_deadline = ContextVar("augmentation_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(deadline=None, cancel=None):
+    """Make every checkpoint() in this context raise DeadlineExceeded after `deadline` or once `cancel` is set."""
+    token = _deadline.set((deadline, cancel))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def checkpoint():
+    """Cooperative interruption point of the long-running stages; a no-op outside deadline_scope."""
+    scope = _deadline.get()
+    if scope is None:
+        return
+    deadline, cancel = scope
+    if (cancel is not None and cancel.is_set()) or (deadline is not None and time.monotonic() >= deadline):
+        raise DeadlineExceeded()
+
+
+def timed(name):
+    """Decorator: run the function as phase `name` of the active trace (a checkpoint on entry)."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            checkpoint()
+            trace = _active.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            with trace.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
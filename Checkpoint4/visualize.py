@@ -1,18 +1,174 @@
-import matplotlib.pyplot as plt
+import os
+import random
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+
 import networkx as nx
+import numpy as np
+from compact_graph import CompactGraph
 
-def draw_graph(G, title="Graph", highlight_edges=None, filename=None):
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(8, 6))
-    nx.draw(G, pos, with_labels=True, node_color='lightblue', edge_color='gray', node_size=700)
+# Above this many vertices spring_layout (O(n^2) per iteration) gives way to
+# the linear-time spectral layout, and labels are no longer drawn
+LARGE_GRAPH_NODES = 300
+# Complement edges drawn at most; the rest of the complement is sampled away
+COMPLEMENT_SAMPLE = 2000
+# Layouts kept, keyed by vertex and edge set; pass `pos` to draw another graph
+# (e.g. the augmented one) on an existing layout
+LAYOUT_CACHE_SIZE = 8
 
-    if highlight_edges:
-        nx.draw_networkx_edges(G, pos, edgelist=highlight_edges, edge_color='red', width=2)
+_layouts = OrderedDict()
 
-    plt.title(title)
-    if filename:
-    #     plt.savefig(f"outputs/{filename}")
-    # plt.show()
 
-        plt.savefig(f"output/{filename}.png")
-    plt.close()
+def fast_layout(G, iterations=100, seed=42):
+    """
+    Spectral-style layout in O(m) per iteration: power iteration of the lazy
+    random walk on two coordinate vectors, kept orthogonal to the constant
+    vector, converges towards the smallest non-trivial Laplacian eigenvectors.
+    """
+    if not isinstance(G, CompactGraph):
+        G = CompactGraph.from_networkx(G, bitset=False)
+    labels, indptr, indices = G.csr()
+    n = len(labels)
+    degree = np.diff(indptr).astype(float)
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    X = np.random.default_rng(seed).standard_normal((n, 2))
+    connected = degree > 0
+    for _ in range(iterations):
+        sums = np.column_stack([np.bincount(rows, weights=X[indices, c], minlength=n) for c in range(2)])
+        walk = X.copy()
+        walk[connected] = sums[connected] / degree[connected, None]
+        X = 0.5 * (X + walk)
+        X -= (degree @ X) / max(degree.sum(), 1)
+        X, _ = np.linalg.qr(X)
+    X -= X.min(axis=0)
+    X /= np.maximum(X.max(axis=0), 1e-12)
+    return dict(zip(labels, (X * 2 - 1).tolist()))
+
+
+def layout(G):
+    """
+    Positions for G's vertices, computed once per graph: spring_layout for
+    small graphs, fast_layout beyond LARGE_GRAPH_NODES. Only a graph with the
+    same vertices and edges reuses the cached layout.
+    """
+    key = (frozenset(G.nodes()), frozenset(frozenset(e) for e in G.edges()))
+    if key in _layouts:
+        _layouts.move_to_end(key)
+        return _layouts[key]
+    if G.number_of_nodes() > LARGE_GRAPH_NODES:
+        pos = fast_layout(G)
+    else:
+        pos = nx.spring_layout(G, seed=42)
+    _layouts[key] = pos
+    if len(_layouts) > LAYOUT_CACHE_SIZE:
+        _layouts.popitem(last=False)
+    return pos
+
+
+def complement_sample(G, limit=COMPLEMENT_SAMPLE, seed=42):
+    """
+    Up to `limit` edges of the complement of G without building it: all of them
+    when there are few enough, otherwise a random sample of non-adjacent pairs.
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    total = n * (n - 1) // 2 - G.number_of_edges()
+    if limit <= 0 or total <= 0:
+        return []
+    if total <= limit:
+        return [(u, v) for i, u in enumerate(nodes) for v in nodes[i + 1:] if not G.has_edge(u, v)]
+    rng = random.Random(seed)
+    seen = set()
+    sample = []
+    while len(sample) < limit:
+        u, v = rng.sample(nodes, 2)
+        if not G.has_edge(u, v) and frozenset((u, v)) not in seen:
+            seen.add(frozenset((u, v)))
+            sample.append((u, v))
+    return sample
+
+
+def _output_path(filename, directory):
+    name = filename[:-4] if filename.endswith(".png") else filename
+    return os.path.join(directory, f"{name}.png")
+
+
+def render(nodes, edges, pos, title, path, overlay=()):
+    """Draw edges in grey and `overlay` in red to a PNG; plain data in, so it can run in a worker."""
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+
+    large = len(nodes) > LARGE_GRAPH_NODES
+    H = nx.Graph()
+    H.add_nodes_from(nodes)
+    H.add_edges_from(edges)
+    fig = Figure(figsize=(8, 6))
+    ax = fig.add_subplot()
+    ax.set_axis_off()
+    nx.draw_networkx_edges(H, pos, ax=ax, edge_color="gray", width=0.3 if large else 1.0)
+    if overlay:
+        nx.draw_networkx_edges(H, pos, ax=ax, edgelist=list(overlay), edge_color="red", width=2)
+    nx.draw_networkx_nodes(H, pos, ax=ax, node_color="lightblue", node_size=5 if large else 700)
+    if not large:
+        nx.draw_networkx_labels(H, pos, ax=ax)
+    ax.set_title(title)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fig.savefig(path)
+    return path
+
+
+class Renderer:
+    """
+    Draws graphs with one cached layout per graph, off the main path.
+
+    With `background`, PNGs are rendered in a worker process and each draw call
+    returns a Future at once; the layout itself is computed (and cached) in the
+    calling process. Use as a context manager, or call close() to wait.
+    """
+
+    def __init__(self, directory="output", background=True):
+        self.directory = directory
+        self._pool = ProcessPoolExecutor(max_workers=1) if background else None
+
+    def _submit(self, *args):
+        if self._pool is not None:
+            return self._pool.submit(render, *args)
+        future = Future()
+        future.set_result(render(*args))
+        return future
+
+    def draw(self, G, title, filename, overlay=(), pos=None):
+        """Draw G, with `overlay` (e.g. the new edges) on top in red; `pos` defaults to layout(G)."""
+        pos = layout(G) if pos is None else pos
+        return self._submit(list(G.nodes()), list(G.edges()), pos, title,
+                            _output_path(filename, self.directory), list(overlay))
+
+    def draw_complement(self, G, title, filename, limit=COMPLEMENT_SAMPLE, pos=None):
+        """Draw (a sample of) G's complement on G's layout (or `pos`); limit=0 skips it."""
+        if limit <= 0:
+            return None
+        pos = layout(G) if pos is None else pos
+        return self._submit(list(G.nodes()), complement_sample(G, limit), pos, title,
+                            _output_path(filename, self.directory))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def draw_graph(G, title="Graph", highlight_edges=None, filename=None, pos=None):
+    """
+    Draw G inline with its cached layout (or `pos`); highlight_edges are drawn
+    in red. The file is output/<filename>, with ".png" appended only when
+    missing.
+    """
+    if filename:
+        render(list(G.nodes()), list(G.edges()), layout(G) if pos is None else pos, title,
+               _output_path(filename, "output"), list(highlight_edges or ()))